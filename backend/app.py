@@ -1,29 +1,74 @@
+import importlib  # Import importlib for loading blueprint modules from the route table
 from flask import Flask  # Import Flask framework for creating web applications
-from flask_jwt_extended import JWTManager  # Import JWTManager for handling JSON Web Tokens
-from routes.scanner_routes import scanner_bp  # Import scanner routes blueprint
-from routes.groups_routes import groups_bp  # Import groups routes blueprint
-from routes.auth import auth_bp  # Import authentication routes blueprint
-from routes.AI import ai_bp  # Import AI routes blueprint
-from config.db import init_db  # Import database initialization function
-from config.config import Config  # Import configuration settings
+from flask_jwt_extended import JWTManager, create_access_token, decode_token  # Import JWT handling
+from config.db import ensure_db, close_db  # Import lazy database initialization and session cleanup
+from config.config import CONFIG  # Import configuration settings
 from config.logging_config import setup_logging  # Import logging setup function
-from flask_cors import CORS  # Import CORS for handling Cross-Origin Resource Sharing
-
-app = Flask(__name__)  # Create a Flask application instance
-app.config.from_object(Config)  # Load configuration settings from Config object
-app.register_blueprint(scanner_bp, url_prefix='/scanner')  # Register scanner routes under '/scanner' prefix
-app.register_blueprint(groups_bp, url_prefix='/groups')  # Register groups routes under '/groups' prefix
-app.register_blueprint(ai_bp, url_prefix='/ai')  # Register AI routes under '/ai' prefix
-app.register_blueprint(auth_bp, url_prefix='/auth')  # Register authentication routes under '/auth' prefix
-
-jwt = JWTManager(app)  # Initialize JWTManager for managing tokens
-setup_logging(app)  # Set up logging for the application
-CORS(app)  # Enable CORS for the Flask app
-
-# Initialize the database within the application context
-with app.app_context():
-    init_db()  # Call the database initialization function
-    
-# Run the application if this script is executed directly
+from config.json_provider import ORJSONProvider  # Import the orjson-based JSON provider
+
+# Route table: URL prefix, blueprint module and blueprint attribute
+BLUEPRINTS = (
+    ('/scanner', 'routes.scanner_routes', 'scanner_bp'),  # Scanner routes
+    ('/groups', 'routes.groups_routes', 'groups_bp'),  # Groups routes
+    ('/ai', 'routes.AI', 'ai_bp'),  # AI routes
+    ('/auth', 'routes.auth', 'auth_bp'),  # Authentication routes
+)
+
+
+def create_app(*, enable_cors=None, enable_ai=True, rotate_logs=True) -> Flask:
+    """
+    Build and configure the Flask application.
+
+    Optional pieces are only imported when enabled, so a deployment that turns
+    them off never loads their dependencies.
+
+    Args:
+        enable_cors: Enable CORS for the blueprints used by the browser frontend. Defaults to CONFIG.ENABLE_CORS.
+        enable_ai: Register the AI blueprint under '/ai'.
+        rotate_logs: Rotate LOG_FILE in-process. Disable it when several processes share the
+            file, and rotate it with logrotate instead.
+
+    Returns:
+        The configured Flask application.
+    """
+    enable_cors = CONFIG.ENABLE_CORS if enable_cors is None else enable_cors  # Fall back to the configured feature flag
+
+    app = Flask(__name__, static_folder=None)  # Create a Flask application instance without a static route; static files belong to the web server
+    app.json = ORJSONProvider(app)  # Serialize every jsonify() response with orjson
+    app.config.update(CONFIG.as_dict())  # Load configuration settings from the CONFIG instance's fields
+    for prefix, module_name, blueprint_name in BLUEPRINTS:
+        if prefix == '/ai' and not enable_ai:
+            continue  # Skip the AI blueprint and its SDK entirely
+        blueprint = getattr(importlib.import_module(module_name), blueprint_name)  # Load the blueprint from its module
+        app.register_blueprint(blueprint, url_prefix=prefix)  # Register the blueprint under its prefix
+
+    # Every blueprint protects its routes with flask_jwt_extended, so JWT support is always on
+    JWTManager(app)  # Initialize JWTManager for managing tokens
+    # Encode and decode a throwaway token so signing is warmed up before the first request
+    # (and, with Gunicorn's preload_app, shared by every forked worker)
+    with app.app_context():
+        decode_token(create_access_token(identity='__warmup__'))
+
+    setup_logging(app, rotate=rotate_logs)  # Set up logging for the application
+
+    if enable_cors:
+        from flask_cors import CORS  # Import CORS for handling Cross-Origin Resource Sharing
+        # Enable CORS only for the blueprints the browser frontend calls, caching preflights for a day
+        CORS(app, resources={
+            r"/auth/*": {"origins": CONFIG.ALLOWED_ORIGINS},
+            r"/scanner/*": {"origins": CONFIG.ALLOWED_ORIGINS},
+            r"/ai/*": {"origins": CONFIG.ALLOWED_ORIGINS},
+        }, max_age=86400, send_wildcard=False)
+
+    # Initialize the database on the first request rather than at import time
+    app.before_request(ensure_db)
+    app.teardown_appcontext(close_db)  # Close the request's DB session when the request ends
+
+    return app
+
+
+# Run the development server if this script is executed directly
 if __name__ == '__main__':
-    app.run(host=app.config['HOST'], port=app.config['PORT'], debug=app.config['DEBUG'])  # Start the Flask server
+    if not CONFIG.DEBUG:
+        raise SystemExit("The development server is only for DEBUG mode. Use: gunicorn -c gunicorn.conf.py wsgi:app")
+    create_app().run(host=CONFIG.HOST, port=CONFIG.PORT, debug=CONFIG.DEBUG)  # Start the Flask server
@@ -1,23 +1,101 @@
-from datetime import timedelta  # Import timedelta for setting token expiration
+from dataclasses import dataclass, field, fields  # Import dataclass helpers for the frozen settings object
 import os  # Import os for interacting with the operating system
-from dotenv import load_dotenv  # Import load_dotenv for loading environment variables from .env file
+from functools import lru_cache  # Import lru_cache for memoizing environment lookups
 
-# Load environment variables from .env file
-load_dotenv()  # Load environment variables defined in the .env file
+# Load environment variables, preferring the compiled cache written by `python -m config.dump_env`
+def load_env():
+    if os.getenv('ENV', 'dev') == 'production':
+        return  # Production sets real environment variables, so skip the .env lookup entirely
 
+    try:
+        from config import _env_cache  # Import the generated cache module, if present
+        # Only trust the cache while the .env it was compiled from is unchanged
+        if os.path.getmtime(_env_cache.SOURCE) <= _env_cache.MTIME:
+            for key, value in _env_cache.VALUES.items():
+                os.environ.setdefault(key, value)  # Real environment variables keep precedence, as with load_dotenv
+            return
+    except (ImportError, OSError):
+        pass  # No cache or its source .env is gone, fall back to parsing
+
+    from dotenv import load_dotenv  # Import load_dotenv for loading environment variables from .env file
+    load_dotenv()  # Load environment variables defined in the .env file
+
+load_env()  # Load environment variables before reading them into Config
+
+# Coercion helpers applied to raw environment values
+def _as_str(value):
+    return value  # Keep the raw string (or None when unset)
+
+def _as_bool(value):
+    return value == 'True'  # Only the literal 'True' enables a flag
+
+def _as_int(value):
+    return int(value)  # Convert numeric settings to integers
+
+def _as_tuple(value):
+    return tuple(item.strip() for item in value.split(',') if item.strip())  # Split comma-separated lists
+
+# Read an environment variable once and cache its coerced value for every later caller
+@lru_cache(maxsize=None)
+def env(name, default=None, cast=_as_str):
+    value = os.getenv(name, default)
+    return cast(value) if value is not None else None
+
+# Build a dataclass field describing which environment variable fills it and how to coerce it
+def env_field(name, cast=_as_str, secret=False, default=None, required=False):
+    return field(
+        default=None,
+        repr=not secret,  # Keep secrets out of repr()
+        metadata={'env': name, 'cast': cast, 'default': default, 'required': required},
+    )
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    DEBUG = os.getenv('DEBUG') == 'True'  # Set DEBUG mode based on environment variable
-    JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)  # Set JWT access token expiration time to 1 hour
-    HOST = os.getenv('HOST')  # Get host address from environment variable
-    PORT = int(os.getenv('PORT'))  # Get port number from environment variable and convert to integer
-    DATABASE_URL = os.getenv('DATABASE_URL')  # Get database URL from environment variable
-    LOG_FILE = os.getenv('LOG_FILE')  # Get log file path from environment variable
-    LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES'))  # Get maximum log file size from environment variable
-    LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT'))  # Get number of backup log files from environment variable
-    LOG_FORMAT = os.getenv('LOG_FORMAT')  # Get log format from environment variable
-    LOG_LEVEL = os.getenv('LOG_LEVEL')  # Get log level from environment variable
-    OPENVAS_SOCKET_PATH = os.getenv('OPENVAS_SOCKET_PATH')  # Get OpenVAS socket path from environment variable
-    OPENVAS_USERNAME = os.getenv('OPENVAS_USERNAME')  # Get OpenVAS username from environment variable
-    OPENVAS_PASSWORD = os.getenv('OPENVAS_PASSWORD')  # Get OpenVAS password from environment variable
-    API_KEY = os.getenv('API_KEY')  # Get API key from environment variable
-    SECRET_KEY = os.getenv('SECRET_KEY')  # Get secret key for cryptographic operations from environment variable
+    DEBUG: bool = env_field('DEBUG', _as_bool, default='False')  # Set DEBUG mode based on environment variable
+    JWT_ACCESS_TOKEN_EXPIRES: int = 3600  # Set JWT access token expiration time to 1 hour, in seconds
+    HOST: str = env_field('HOST')  # Get host address from environment variable
+    PORT: int = env_field('PORT', _as_int, required=True)  # Get port number from environment variable and convert to integer
+    DATABASE_URL: str = env_field('DATABASE_URL', required=True)  # Get database URL from environment variable
+    LOG_FILE: str = env_field('LOG_FILE', required=True)  # Get log file path from environment variable
+    LOG_MAX_BYTES: int = env_field('LOG_MAX_BYTES', _as_int, required=True)  # Get maximum log file size from environment variable
+    LOG_BACKUP_COUNT: int = env_field('LOG_BACKUP_COUNT', _as_int, required=True)  # Get number of backup log files from environment variable
+    LOG_FORMAT: str = env_field('LOG_FORMAT')  # Get log format from environment variable
+    LOG_LEVEL: str = env_field('LOG_LEVEL')  # Get log level from environment variable
+    OPENVAS_SOCKET_PATH: str = env_field('OPENVAS_SOCKET_PATH')  # Get OpenVAS socket path from environment variable
+    OPENVAS_USERNAME: str = env_field('OPENVAS_USERNAME')  # Get OpenVAS username from environment variable
+    OPENVAS_PASSWORD: str = env_field('OPENVAS_PASSWORD', secret=True)  # Get OpenVAS password from environment variable
+    OPENVAS_DEBUG: bool = env_field('OPENVAS_DEBUG', _as_bool, default='False')  # Log raw GMP list responses at DEBUG level
+    API_KEY: str = env_field('API_KEY', secret=True)  # Get API key from environment variable
+    SECRET_KEY: str = env_field('SECRET_KEY', secret=True)  # Get secret key for cryptographic operations from environment variable
+    ENABLE_CORS: bool = env_field('ENABLE_CORS', _as_bool, default='True')  # Enable CORS unless explicitly disabled
+    ALLOWED_ORIGINS: tuple = env_field('ALLOWED_ORIGINS', _as_tuple, default='*')  # Get browser origins allowed by CORS, any origin if unset
+
+    # Read, coerce and validate every setting in one pass, reporting all problems together
+    @classmethod
+    def from_env(cls):
+        values = {}
+        errors = []
+        for config_field in fields(cls):
+            spec = config_field.metadata
+            if 'env' not in spec:
+                continue  # Fixed settings keep their class default
+            try:
+                value = env(spec['env'], spec['default'], spec['cast'])
+            except ValueError:
+                errors.append(f"{spec['env']}={os.getenv(spec['env'])!r} is not a valid {config_field.type.__name__}")
+                continue
+            if value is None:
+                if spec['required']:
+                    errors.append(f"{spec['env']} is not set")
+                continue
+            values[config_field.name] = value
+
+        if errors:
+            raise ValueError(f"Invalid configuration: {'; '.join(errors)}")
+        return cls(**values)
+
+    # Export the settings as a plain dict, e.g. for app.config.update()
+    def as_dict(self):
+        return {config_field.name: getattr(self, config_field.name) for config_field in fields(self)}
+
+CONFIG = Config.from_env()  # Read the environment once at boot; every module shares this frozen instance
@@ -1,12 +1,22 @@
 from sqlalchemy import create_engine, Column, String, Integer, ForeignKey, Table, Enum  # Import necessary SQLAlchemy classes and functions
 from sqlalchemy.ext.declarative import declarative_base  # Import declarative_base for creating model classes
 from sqlalchemy.orm import sessionmaker, relationship  # Import sessionmaker for creating sessions and relationship for defining relationships
-from config.config import Config  # Import configuration settings
+from config.config import CONFIG  # Import configuration settings
 import enum  # Import enum for defining enumerations
+import fcntl  # Import fcntl for a file lock shared between worker processes
+import os  # Import os for building the lock file path
+import tempfile  # Import tempfile for locating the system temp directory
+import threading  # Import threading for guarding one-time initialization within a process
 from werkzeug.security import generate_password_hash, check_password_hash  # Import functions for password hashing
+from contextvars import ContextVar  # Import ContextVar for binding the session to the current request
 
 # Create the database engine
-engine = create_engine(Config.DATABASE_URL)  # Create a SQLAlchemy engine using the database URL from config
+engine = create_engine(
+    CONFIG.DATABASE_URL,  # Database URL from config
+    pool_size=6,  # Connections kept open for reuse across requests
+    max_overflow=12,  # Extra connections allowed under bursts
+    pool_pre_ping=True,  # Replace stale connections before handing them out
+)
 
 # Create a declarative base class
 Base = declarative_base()  # Create a base class for model definitions
@@ -66,10 +76,42 @@ class Group(Base):
 def init_db():
     Base.metadata.create_all(bind=engine)  # Create all tables in the database based on the defined models
 
-# Dependency to get DB session
+# State for running init_db lazily, once per process, on the first request
+_db_ready = False  # Flipped once the schema has been checked in this process
+_db_lock = threading.Lock()  # Serializes the first-request check between threads
+DB_INIT_LOCK_FILE = os.path.join(tempfile.gettempdir(), 'vulnscan.dbinit')  # Lock file shared by all workers
+
+# Initialize the database on first use instead of at import time
+def ensure_db():
+    global _db_ready
+    if _db_ready:
+        return  # Fast path once the schema is known to exist
+
+    with _db_lock:
+        if _db_ready:
+            return  # Another thread finished initialization while we waited
+        with open(DB_INIT_LOCK_FILE, 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)  # Only one worker process creates tables at a time
+            try:
+                init_db()
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        _db_ready = True
+
+# Session bound to the current request; each thread or greenlet serving a request has its own value
+_db_session = ContextVar('db_session', default=None)
+
+# Get the DB session for the current request, creating it on first use
 def get_db():
-    db = SessionLocal()  # Create a new database session
-    try:
-        yield db  # Yield the session for use in requests
-    finally:
-        db.close()  # Ensure the session is closed after use
+    db = _db_session.get()
+    if db is None:
+        db = SessionLocal()  # Create one session shared by decorators and views for this request
+        _db_session.set(db)
+    return db
+
+# Close the current request's DB session, if one was opened (registered as an app teardown)
+def close_db(exception=None):
+    db = _db_session.get()
+    if db is not None:
+        _db_session.set(None)  # Don't hand a closed session to the next request on this thread
+        db.close()  # Return the connection to the pool
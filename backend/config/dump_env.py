@@ -0,0 +1,22 @@
+import os  # Import os for file paths and modification times
+import pprint  # Import pprint for writing the values as a readable Python literal
+from dotenv import dotenv_values, find_dotenv  # Import dotenv helpers for locating and parsing the .env file
+
+# Path of the generated module imported by config.config
+CACHE_FILE = os.path.join(os.path.dirname(__file__), '_env_cache.py')
+
+# Compile the .env file into a plain Python module so workers skip dotenv parsing at boot
+def dump_env(cache_file=CACHE_FILE):
+    source = find_dotenv(raise_error_if_not_found=True)  # Locate .env the same way load_dotenv does
+    values = {key: value for key, value in dotenv_values(source).items() if value is not None}  # Skip keys without a value
+
+    with open(cache_file, 'w') as f:
+        f.write("# Generated by `python -m config.dump_env` -- do not edit, rerun after changing .env\n")
+        f.write(f"SOURCE = {source!r}\n")
+        f.write(f"MTIME = {os.path.getmtime(source)!r}\n")
+        f.write(f"VALUES = {pprint.pformat(values)}\n")
+
+    return cache_file
+
+if __name__ == '__main__':
+    print(f"Wrote {dump_env()}")
@@ -0,0 +1,19 @@
+import orjson  # Import orjson for fast, C-implemented JSON encoding and decoding
+from flask import Response  # Import Response for building JSON responses from raw bytes
+from flask.json.provider import DefaultJSONProvider  # Import Flask's default provider to reuse its fallback encoder
+
+# JSON provider that serializes responses with orjson instead of the standard json module
+class ORJSONProvider(DefaultJSONProvider):
+    option = orjson.OPT_NON_STR_KEYS  # Allow dicts keyed by ints/enums, as the standard encoder does
+
+    def dumps(self, obj, **kwargs):
+        # Types orjson doesn't handle natively (e.g. Decimal) go through Flask's default encoder
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)  # Parse request bodies with orjson as well
+
+
+# Build a JSON response directly from orjson's bytes, skipping the str round-trip that jsonify() makes
+def ojson(payload, status=200):
+    return Response(orjson.dumps(payload, default=ORJSONProvider.default, option=ORJSONProvider.option), status=status, mimetype='application/json')
@@ -1,7 +1,10 @@
+import atexit  # Import atexit for flushing queued log records on shutdown
 import logging  # Import logging module for logging capabilities
-from logging.handlers import RotatingFileHandler  # Import RotatingFileHandler for log rotation
+import queue  # Import queue for handing log records to the background writer
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, WatchedFileHandler  # Import handlers for queued logging and log rotation
 from uuid import uuid4  # Import uuid4 for generating unique request IDs
 from flask import Flask, jsonify, request  # Import Flask and necessary components from Flask
+from config.config import CONFIG  # Import configuration settings
 
 # Custom formatter class for logging
 class CustomFormatter(logging.Formatter):
@@ -13,33 +16,64 @@ class CustomFormatter(logging.Formatter):
             return f"{log_entry}\n{'='*100}\n"  # Append separator for better readability
         return log_entry
 
-# Function to set up logging configuration
-def setup_logging(app: Flask):
+# Queue and output handlers shared by the background log writer
+_log_queue = queue.Queue(-1)  # Unbounded queue so logging never blocks a request
+_log_handlers = []  # File/console handlers drained by the listener thread
+_log_listener = None  # Currently running QueueListener, if any
+
+# Start (or restart, e.g. in a freshly forked worker) the thread that writes queued log records
+def start_log_listener():
+    global _log_listener
+    _log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+    _log_listener.start()
+
+# Flush and stop the background log writer
+def stop_log_listener():
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+atexit.register(stop_log_listener)  # Write out any queued records when the process exits
+
+# Function to set up logging configuration. Pass rotate=False when several processes write
+# the same LOG_FILE (Gunicorn workers): each would rotate it on its own and lose lines, so the
+# file is reopened after an external logrotate moves it instead.
+def setup_logging(app: Flask, rotate=True):
     # Clear any existing handlers to prevent duplicate logs
     if app.logger.hasHandlers():
         app.logger.handlers.clear()
 
-    # Set up a file handler for logging to a file with rotation
-    log_handler = RotatingFileHandler(
-        app.config['LOG_FILE'],  # Path to the log file from config
-        maxBytes=app.config['LOG_MAX_BYTES'],  # Maximum file size before rotation
-        backupCount=app.config['LOG_BACKUP_COUNT']  # Number of backup files to keep
-    )
+    if rotate:
+        # Set up a file handler for logging to a file with rotation
+        log_handler = RotatingFileHandler(
+            CONFIG.LOG_FILE,  # Path to the log file from config
+            maxBytes=CONFIG.LOG_MAX_BYTES,  # Maximum file size before rotation
+            backupCount=CONFIG.LOG_BACKUP_COUNT  # Number of backup files to keep
+        )
+    else:
+        log_handler = WatchedFileHandler(CONFIG.LOG_FILE)  # Reopen the file once logrotate has moved it
     
     # Create a custom formatter for the logs
-    formatter = CustomFormatter(app.config['LOG_FORMAT'])  # Use the defined custom formatter
+    formatter = CustomFormatter(CONFIG.LOG_FORMAT)  # Use the defined custom formatter
     log_handler.setFormatter(formatter)  # Set the formatter for the log handler
-    log_handler.setLevel(app.config['LOG_LEVEL'])  # Set the log level for the handler
-    app.logger.addHandler(log_handler)  # Attach the file handler to the app logger
+    log_handler.setLevel(CONFIG.LOG_LEVEL)  # Set the log level for the handler
+    handlers = [log_handler]  # Handlers written to by the background listener
 
     # Add a console handler if DEBUG mode is enabled
-    if app.config['DEBUG']:
+    if CONFIG.DEBUG:
         console_handler = logging.StreamHandler()  # Create a stream handler for console output
         console_handler.setFormatter(formatter)  # Set the custom formatter
-        console_handler.setLevel(app.config['LOG_LEVEL'])  # Set the log level for the console
-        app.logger.addHandler(console_handler)  # Attach the console handler to the app logger
+        console_handler.setLevel(CONFIG.LOG_LEVEL)  # Set the log level for the console
+        handlers.append(console_handler)  # Write console output from the listener as well
+
+    # Request threads only enqueue records; file writes and rotation happen on the listener thread
+    stop_log_listener()  # Stop a listener left over from a previous setup_logging call
+    _log_handlers[:] = handlers
+    app.logger.addHandler(QueueHandler(_log_queue))  # Attach the queue handler to the app logger
+    start_log_listener()
 
-    app.logger.setLevel(app.config['LOG_LEVEL'])  # Set the overall log level for the logger
+    app.logger.setLevel(CONFIG.LOG_LEVEL)  # Set the overall log level for the logger
 
     # Log request information before handling the request
     @app.before_request
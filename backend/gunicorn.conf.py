@@ -0,0 +1,15 @@
+import os  # Import os for reading the CPU count
+from config.config import CONFIG  # Import configuration settings for the bind address
+
+bind = f"{CONFIG.HOST or '0.0.0.0'}:{CONFIG.PORT}"  # Listen on the configured host (all interfaces if HOST is unset) and port
+worker_class = 'gevent'  # Use gevent workers so slow OpenVAS calls don't block other requests
+workers = (os.cpu_count() or 1) * 2 + 1  # Standard Gunicorn sizing for I/O-bound apps
+worker_connections = 1000  # Maximum concurrent clients handled by each gevent worker
+preload_app = True  # Import the app once in the master so workers share its memory copy-on-write
+
+# Give each forked worker its own database connection pool and log writer thread
+def post_fork(server, worker):
+    from config.db import engine  # Import the engine created when the master preloaded the app
+    from config.logging_config import start_log_listener  # Import the log writer starter
+    engine.dispose(close=False)  # Drop inherited pooled connections without closing the master's sockets
+    start_log_listener()  # Threads don't survive fork, so start this worker's own listener
@@ -1,17 +1,34 @@
+import threading
 from functools import wraps
+from routes.auth import load_current_user
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import get_jwt_identity, jwt_required
-import google.generativeai as genai
-from requests import Session
-from config.config import Config
-from config.db import User, get_db
-
-# Initialize the Generative AI model
-genai.configure(api_key=Config.API_KEY)
-model = genai.GenerativeModel("gemini-1.5-flash")
+from flask_jwt_extended import jwt_required
+from config.config import CONFIG
 
 ai_bp = Blueprint('ai', __name__)
 
+# The Generative AI client is imported and configured on the first /ai request,
+# so workers that never serve this blueprint don't pay for the google SDK import
+_model = None
+_model_lock = threading.Lock()  # Guards the one-time SDK setup against concurrent first requests
+
+
+def get_model():
+    """
+    Return the shared Generative AI model, importing and configuring the SDK on first use.
+
+    Returns:
+        The GenerativeModel instance used for CVE analysis.
+    """
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:  # Another request may have finished the setup while we waited
+                import google.generativeai as genai
+                genai.configure(api_key=CONFIG.API_KEY)
+                _model = genai.GenerativeModel("gemini-1.5-flash")
+    return _model
+
 
 def token_required(fn):
     """
@@ -26,14 +43,10 @@ def token_required(fn):
     @wraps(fn)
     @jwt_required()
     def wrapper(*args, **kwargs):
-        # Access the database session
-        db: Session = next(get_db())
-        # Get the current user's ID from the token
-        current_user_id = get_jwt_identity()
-        # Retrieve the user from the database
-        current_user = db.query(User).filter_by(id=current_user_id).first()
+        # Look the user up once per request, with a short-lived cache across requests
+        exists, _ = load_current_user()
         
-        if not current_user:
+        if not exists:
             return jsonify({"error": "User not found!"}), 403
         
         return fn(*args, **kwargs)
@@ -51,7 +64,7 @@ def analyze_cve():
         A JSON response containing the analysis results for each CVE.
     """
     responses = []
-    data = request.json
+    data = request.get_json()
     results = data.get('results', [])
      
     for result in results:
@@ -84,7 +97,7 @@ def analyze_cve():
                 
                 # Get the response from the AI model
                 try:
-                    response = model.generate_content(query)
+                    response = get_model().generate_content(query)
                     responses.append({
                         'cve': cve,
                         'answer': response.text if response else "No response from AI."
@@ -1,12 +1,45 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app, g
 from sqlalchemy.orm import Session
 from config.db import get_db, User, UserRole
-from config.config import Config
+from config.config import CONFIG
 from functools import wraps
+import threading
+from cachetools import TTLCache
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
 
 auth_bp = Blueprint('auth', __name__)
-SECRET_KEY = Config.SECRET_KEY
+SECRET_KEY = CONFIG.SECRET_KEY
+
+# Short-lived cache of user_id -> (exists, role) so back-to-back requests skip the user lookup
+user_cache = TTLCache(maxsize=1024, ttl=15)
+user_cache_lock = threading.Lock()
+
+def load_current_user():
+    """
+    Resolve the JWT identity to an (exists, role) pair.
+
+    The result is kept on flask.g for the rest of the request and in user_cache for a few
+    seconds, so the database is only queried on a cache miss. Shared by the token_required and
+    admin_required decorators of every blueprint.
+    """
+    if 'current_user' in g:
+        return g.current_user
+
+    current_user_id = get_jwt_identity()
+    with user_cache_lock:
+        current_user = user_cache.get(current_user_id)
+
+    if current_user is None:
+        db: Session = get_db()
+        # Retrieve the user from the database
+        user = db.query(User).filter_by(id=current_user_id).first()
+        current_user = (user is not None, user.role if user is not None else None)
+        with user_cache_lock:
+            user_cache[current_user_id] = current_user
+
+    g.current_user = current_user
+    return current_user
+
 
 
 def admin_required(fn):
@@ -22,19 +55,15 @@ def admin_required(fn):
     @wraps(fn)
     @jwt_required()
     def wrapper(*args, **kwargs):
-        # Access the database session
-        db: Session = next(get_db())
-        # Get the current user's ID from the token
-        current_user_id = get_jwt_identity()
-        # Retrieve the user from the database
-        current_user = db.query(User).filter_by(id=current_user_id).first()
+        # Check the role stored in the database (via the short-lived user cache), so demoted or deleted users lose access
+        exists, role = load_current_user()
 
-        if not current_user:
+        if not exists:
             return jsonify({"error": "User not found!"}), 403
         
         # Compare with UserRole.ADMIN correctly
-        if current_user.role != UserRole.ADMIN:
-            print(f"Access Denied: {current_user.role} does not match {UserRole.ADMIN}")
+        if role != UserRole.ADMIN:
+            current_app.logger.warning("Access Denied: %s does not match %s", role, UserRole.ADMIN)
             return jsonify({"error": "Admin access required"}), 403
         
         return fn(*args, **kwargs)
@@ -53,8 +82,8 @@ def signup():
     Returns:
         JSON response with a success or error message.
     """
-    db: Session = next(get_db())
-    data = request.json
+    db: Session = get_db()
+    data = request.get_json()
 
     # Extract data from the request
     username = data.get('username')
@@ -98,8 +127,8 @@ def create_admin():
     Returns:
         JSON response with a success or error message.
     """
-    db: Session = next(get_db())
-    data = request.json
+    db: Session = get_db()
+    data = request.get_json()
 
     # Extract data from the request
     username = data.get('username')
@@ -142,8 +171,8 @@ def signin():
     Returns:
         JSON response containing the access token and user information or an error message.
     """
-    db: Session = next(get_db())
-    data = request.json
+    db: Session = get_db()
+    data = request.get_json()
 
     # Extract email and password from the request
     email = data.get('email').lower()
@@ -190,8 +219,8 @@ def modify_user(user_id):
     Returns:
         JSON response indicating success or error.
     """
-    db: Session = next(get_db())
-    data = request.json
+    db: Session = get_db()
+    data = request.get_json()
 
     # Find the user by ID in the database
     user = db.query(User).filter_by(id=user_id).first()
@@ -199,6 +228,8 @@ def modify_user(user_id):
     if not user:
         return jsonify({"error": "User not found"}), 404
 
+    role_changed = False
+
     # Update user details based on the provided data
     if 'username' in data:
         # Check if the new username already exists
@@ -217,6 +248,7 @@ def modify_user(user_id):
         if data['role'] not in [UserRole.USER, UserRole.ADMIN]:
             return jsonify({"error": "Invalid role specified"}), 400
         user.role = data['role']
+        role_changed = True
     
     if 'password' in data:
         # Set the new password
@@ -229,6 +261,10 @@ def modify_user(user_id):
     # Commit the changes to the database
     db.commit()
 
+    if role_changed:
+        with user_cache_lock:
+            user_cache.pop(user_id, None)  # Drop the cached role so the next lookup sees the change
+
     # Return a success message
     return jsonify({"message": "User updated successfully"}), 200
 
@@ -248,7 +284,7 @@ def delete_user(user_id):
     Returns:
         JSON response indicating success or error.
     """
-    db: Session = next(get_db())
+    db: Session = get_db()
 
     # Find the user by ID in the database
     user = db.query(User).filter_by(id=user_id).first()
@@ -259,6 +295,8 @@ def delete_user(user_id):
     # Delete the user from the database
     db.delete(user)
     db.commit()
+    with user_cache_lock:
+        user_cache.pop(user_id, None)  # Don't keep reporting the deleted user as existing
 
     # Return a success message
     return jsonify({"message": "User deleted successfully"}), 200
@@ -275,7 +313,7 @@ def get_user():
     Returns:
         JSON response containing the user's details or an error message.
     """
-    db: Session = next(get_db())
+    db: Session = get_db()
     
     # Get the current user's ID from the JWT token
     current_user_id = get_jwt_identity()
@@ -308,7 +346,7 @@ def get_users():
     Returns:
         JSON response containing a list of users with their details.
     """
-    db: Session = next(get_db())
+    db: Session = get_db()
     
     # Get all users from the database
     users = db.query(User).all()
@@ -1,8 +1,9 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from sqlalchemy.orm import Session
-from config.db import get_db, Group, Target, UserRole, User
+from config.db import get_db, Group, Target, UserRole
 from functools import wraps
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from routes.auth import load_current_user
+from flask_jwt_extended import jwt_required
 
 groups_bp = Blueprint('groups', __name__)
 
@@ -10,14 +11,10 @@ def token_required(fn):
     @wraps(fn)
     @jwt_required()
     def wrapper(*args, **kwargs):
-        # Access the database session
-        db: Session = next(get_db())
-        # Get the current user's ID from the token
-        current_user_id = get_jwt_identity()
-        # Retrieve the user from the database
-        current_user = db.query(User).filter_by(id=current_user_id).first()
+        # Look the user up once per request, with a short-lived cache across requests
+        exists, _ = load_current_user()
         
-        if not current_user:
+        if not exists:
             return jsonify({"error": "User not found!"}), 403
         
         return fn(*args, **kwargs)
@@ -27,19 +24,15 @@ def admin_required(fn):
     @wraps(fn)
     @jwt_required()
     def wrapper(*args, **kwargs):
-        # Access the database session
-        db: Session = next(get_db())
-        # Get the current user's ID from the token
-        current_user_id = get_jwt_identity()
-        # Retrieve the user from the database
-        current_user = db.query(User).filter_by(id=current_user_id).first()
-
-        if not current_user:
+        # Check the role stored in the database (via the short-lived user cache), so demoted or deleted users lose access
+        exists, role = load_current_user()
+
+        if not exists:
             return jsonify({"error": "User not found!"}), 403
-        
+
         # Ensure the user has admin privileges
-        if current_user.role != UserRole.ADMIN:
-            print(f"Access Denied: {current_user.role} does not match {UserRole.ADMIN}")
+        if role != UserRole.ADMIN:
+            current_app.logger.warning("Access Denied: %s does not match %s", role, UserRole.ADMIN)
             return jsonify({"error": "Admin access required"}), 403
         
         return fn(*args, **kwargs)
@@ -52,13 +45,13 @@ def create_group():
     Endpoint to create a new group.
     Admin access is required.
     """
-    data = request.json
+    data = request.get_json()
     group_name = data.get('group_name')
     
     if not group_name:
         return jsonify({"error": "group_name is required"}), 400
     
-    db: Session = next(get_db())
+    db: Session = get_db()
     group = Group(name=group_name)
     db.add(group)
     db.commit()
@@ -72,7 +65,7 @@ def get_groups():
     Endpoint to retrieve all groups.
     Any authenticated user can access this.
     """
-    db: Session = next(get_db())
+    db: Session = get_db()
     groups = db.query(Group).all()
     groups_data = [{"id": g.id, "name": g.name} for g in groups]
 
@@ -85,13 +78,13 @@ def rename_group(group_id):
     Endpoint to rename an existing group.
     Admin access is required.
     """
-    data = request.json
+    data = request.get_json()
     new_name = data.get('group_name')
     
     if not new_name:
         return jsonify({"error": "group_name is required"}), 400
     
-    db: Session = next(get_db())
+    db: Session = get_db()
     group = db.query(Group).filter(Group.id == group_id).first()
     
     if not group:
@@ -109,7 +102,7 @@ def delete_group(group_id):
     Endpoint to delete a group by its ID.
     Admin access is required.
     """
-    db: Session = next(get_db())
+    db: Session = get_db()
     group = db.query(Group).filter(Group.id == group_id).first()
     
     if not group:
@@ -127,14 +120,14 @@ def remove_from_group():
     Endpoint to remove a target from a group.
     Admin access is required.
     """
-    data = request.json
+    data = request.get_json()
     target_id = data.get('target_id')
     group_id = data.get('group_id')
     
     if not target_id or not group_id:
         return jsonify({"error": "target_id and group_id are required"}), 400
     
-    db: Session = next(get_db())
+    db: Session = get_db()
     target = db.query(Target).filter(Target.id == target_id, Target.group_id == group_id).first()
     
     if not target:
@@ -153,12 +146,12 @@ def add_target():
     Endpoint to add a new target to a group.
     Admin access is required.
     """
-    data = request.json
+    data = request.get_json()
     name = data.get('name')
     ip_address = data.get('ip_address')
     group_id = data.get('group_id')
 
-    db: Session = next(get_db())
+    db: Session = get_db()
     target = Target(name=name, ip_address=ip_address, group_id=group_id)
     db.add(target)
     db.commit()
@@ -172,7 +165,7 @@ def get_group_targets(group_id):
     Endpoint to retrieve all targets in a specific group.
     Any authenticated user can access this.
     """
-    db: Session = next(get_db())
+    db: Session = get_db()
     targets = db.query(Target).filter(Target.group_id == group_id).all()
     targets_data = [{"id": t.id, "name": t.name, "ip_address": t.ip_address} for t in targets]
 
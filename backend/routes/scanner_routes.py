@@ -1,17 +1,110 @@
-from flask import jsonify, request, Blueprint, send_file
+from flask import request, Blueprint, send_file, current_app, Response
 from scanner.openvas import OpenVASScanner
-from config.db import User, get_db, UserRole
-from config.config import Config
-from sqlalchemy.orm import Session
-from icalendar import Calendar, Event
-from datetime import datetime
-import pytz
+from scanner.ical import make_icalendar
+from config.db import UserRole
+from config.config import CONFIG
+from config.json_provider import ojson
+from routes.schemas import (
+    load_request, ConvertHostsRequest, CreateTargetRequest, ModifyTargetRequest, CreateTaskRequest, ModifyTaskRequest,
+    CreateScheduleRequest, ModifyScheduleRequest, CreateAlertRequest, ModifyAlertRequest,
+    CreateAlertsRequest, DeleteAlertsRequest, DeleteSchedulesRequest,
+)
+from pydantic import ValidationError
+from werkzeug.exceptions import HTTPException
+import hashlib
+import io
+import orjson
+import re
 from functools import wraps
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from routes.auth import load_current_user
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from cachetools import TTLCache
+from flask_jwt_extended import jwt_required
 
 scanner_bp = Blueprint('scanner_bp', __name__)
-# Initialize the OpenVASScanner with the specified configuration
-scanner = OpenVASScanner(socket_path=Config.OPENVAS_SOCKET_PATH, username=Config.OPENVAS_USERNAME, password=Config.OPENVAS_PASSWORD)
+
+# Guards creation of the per-worker OpenVASScanner
+scanner_lock = threading.Lock()
+
+def get_scanner():
+    """
+    Return this worker's OpenVASScanner, creating it on first use.
+
+    The scanner is kept in app.extensions rather than built at import time, so with
+    Gunicorn's preload_app each forked worker creates its own instance.
+    """
+    scanner = current_app.extensions.get('openvas')
+    if scanner is None:
+        with scanner_lock:
+            scanner = current_app.extensions.get('openvas')
+            if scanner is None:
+                # Initialize the OpenVASScanner with the specified configuration
+                scanner = OpenVASScanner(socket_path=CONFIG.OPENVAS_SOCKET_PATH, username=CONFIG.OPENVAS_USERNAME, password=CONFIG.OPENVAS_PASSWORD)
+                current_app.extensions['openvas'] = scanner
+    return scanner
+
+# Maximum number of concurrent create_target calls made by convert_hosts_to_targets
+TARGET_CREATE_WORKERS = 8
+
+# Separator between hosts in a comma-separated host list
+_HOSTS_SPLIT = re.compile(r'\s*,\s*')
+# A comma-separated list of IPs, ranges, CIDRs or hostnames
+_HOSTS_VALID = re.compile(r'[\w.:/-]+(?:\s*,\s*[\w.:/-]+)*')
+
+def conditional_json(body, etag):
+    """
+    Return a pre-serialized JSON body with its ETag, or an empty 304 if it matches the client's If-None-Match.
+    """
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+# Collapses bursts of get_task_status polls: task_id -> (JSON body, ETag), kept for half a second
+task_status_cache = TTLCache(maxsize=1024, ttl=0.5)
+task_status_cache_lock = threading.Lock()
+
+# Content types for the formats supported by export_report
+EXPORT_MIMETYPES = {
+    'csv': 'text/csv',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'pdf': 'application/pdf',
+}
+
+# Short-lived cache for read-only OpenVAS lists that the dashboard polls
+list_cache = TTLCache(maxsize=32, ttl=30)
+# Reference data that only changes on the OpenVAS side, and rarely, is kept for longer
+reference_cache = TTLCache(maxsize=8, ttl=300)
+REFERENCE_LISTS = frozenset(('get_roles', 'get_scanners', 'get_configs', 'get_portlists'))
+list_cache_lock = threading.Lock()  # Guards both list caches
+
+def _list_cache_for(key):
+    """
+    Return the cache a list is stored in: reference_cache for REFERENCE_LISTS, list_cache otherwise.
+    """
+    return reference_cache if key in REFERENCE_LISTS else list_cache
+
+def cached_list(key, fetch):
+    """
+    Return the cached list stored under key, calling fetch() to fill the cache on a miss.
+    Errors raised by fetch() are not cached.
+    """
+    cache = _list_cache_for(key)
+    with list_cache_lock:
+        if key in cache:
+            return cache[key]
+    value = fetch()
+    with list_cache_lock:
+        cache[key] = value
+    return value
+
+def invalidate_lists(*keys):
+    """
+    Drop cached lists so the next read sees changes made by a mutating endpoint.
+    """
+    with list_cache_lock:
+        for key in keys:
+            _list_cache_for(key).pop(key, None)
 
 def token_required(fn):
     """
@@ -20,15 +113,10 @@ def token_required(fn):
     @wraps(fn)
     @jwt_required()
     def wrapper(*args, **kwargs):
-        # Access the database session
-        db: Session = next(get_db())
-        # Get the current user's ID from the token
-        current_user_id = get_jwt_identity()
-        # Retrieve the user from the database
-        current_user = db.query(User).filter_by(id=current_user_id).first()
+        exists, _ = load_current_user()
         
-        if not current_user:
-            return jsonify({"error": "User not found!"}), 403
+        if not exists:
+            return ojson({"error": "User not found!"}, 403)
         
         return fn(*args, **kwargs)
     return wrapper
@@ -40,26 +128,42 @@ def admin_required(fn):
     @wraps(fn)
     @jwt_required()
     def wrapper(*args, **kwargs):
-        # Access the database session
-        db: Session = next(get_db())
-        # Get the current user's ID from the token
-        current_user_id = get_jwt_identity()
-        # Retrieve the user from the database
-        current_user = db.query(User).filter_by(id=current_user_id).first()
-
-        if not current_user:
-            return jsonify({"error": "User not found!"}), 403
-        
+        # Check the role stored in the database (via the short-lived user cache), so demoted or deleted users lose access
+        exists, role = load_current_user()
+
+        if not exists:
+            return ojson({"error": "User not found!"}, 403)
+
         # Check if the current user has admin role
-        if current_user.role != UserRole.ADMIN:
-            print(f"Access Denied: {current_user.role} does not match {UserRole.ADMIN}")
-            return jsonify({"error": "Admin access required"}), 403
+        if role != UserRole.ADMIN:
+            current_app.logger.warning("Access Denied: %s does not match %s", role, UserRole.ADMIN)
+            return ojson({"error": "Admin access required"}, 403)
         
         return fn(*args, **kwargs)
     return wrapper
 
 
 
+@scanner_bp.errorhandler(ValidationError)
+def handle_validation_error(e):
+    """
+    Return 400 with the validation errors when a request body doesn't match its schema.
+    """
+    return ojson({"error": e.errors(include_url=False, include_context=False, include_input=False)}, 400)
+
+
+@scanner_bp.errorhandler(Exception)
+def handle_unexpected_error(e):
+    """
+    Return a generic 500 for exceptions the scanner routes don't handle themselves.
+    HTTP errors (e.g. a malformed JSON body) keep their own status.
+    """
+    if isinstance(e, HTTPException):
+        return e
+    current_app.logger.exception("Unhandled error in %s", request.path)
+    return ojson({"status": "error", "message": "An unexpected error occurred"}, 500)
+
+
 @scanner_bp.route('/authenticate', methods=['POST'])
 @token_required
 def authenticate():
@@ -68,11 +172,11 @@ def authenticate():
     Returns a success message if authentication is successful.
     """
     try:
-        scanner.authenticate()  # Attempt to authenticate the scanner
-        return jsonify({"message": "Authenticated successfully"}), 200  # Return success message
+        get_scanner().authenticate()  # Attempt to authenticate the scanner
+        return ojson({"message": "Authenticated successfully"})  # Return success message
     except ValueError as e:
         # Return the detailed error message
-        return jsonify({"error": str(e)}), 500  # Return error if authentication fails
+        return ojson({"error": str(e)}, 500)  # Return error if authentication fails
 
 
 @scanner_bp.route('/get_roles', methods=['GET'])
@@ -83,10 +187,10 @@ def get_roles():
     Returns the roles in JSON format.
     """
     try:
-        roles = scanner.get_roles()  # Get user roles from the scanner
-        return jsonify(roles), 200  # Return roles as JSON
+        roles = cached_list('get_roles', get_scanner().get_roles)  # Get user roles from the scanner
+        return ojson(roles)  # Return roles as JSON
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400  # Return error if role retrieval fails
+        return ojson({"error": str(e)}, 400)  # Return error if role retrieval fails
 
 
 @scanner_bp.route('/get_users', methods=['GET'])
@@ -97,10 +201,10 @@ def get_users():
     Returns the users in JSON format.
     """
     try:
-        users = scanner.get_users()  # Get users from the scanner
-        return jsonify(users), 200  # Return users as JSON
+        users = cached_list('get_users', get_scanner().get_users)  # Get users from the scanner
+        return ojson(users)  # Return users as JSON
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400  # Return error if user retrieval fails
+        return ojson({"error": str(e)}, 400)  # Return error if user retrieval fails
 
 
 
@@ -113,10 +217,10 @@ def get_user(user_id):
     """
     try:
         # Call the method to get user details by ID
-        user = scanner.get_user(user_id=user_id)  # Retrieve user details using the scanner
-        return jsonify(user), 200  # Return user details as JSON
+        user = get_scanner().get_user(user_id=user_id)  # Retrieve user details using the scanner
+        return ojson(user)  # Return user details as JSON
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400  # Return error if user retrieval fails
+        return ojson({"error": str(e)}, 400)  # Return error if user retrieval fails
 
 
 @scanner_bp.route('/create_user', methods=['POST'])
@@ -127,16 +231,17 @@ def create_user():
     Requires admin privileges to execute.
     Returns the result of the user creation operation.
     """
-    data = request.json  # Get JSON data from the request
+    data = request.get_json()  # Get JSON data from the request
     name = data.get('name')  # Extract the user's name
     password = data.get('password')  # Extract the user's password
     role_ids = data.get('role_ids', [])  # Extract role IDs, defaulting to an empty list
     
     try:
-        result = scanner.create_user(name=name, password=password, role_ids=role_ids)  # Create user
-        return jsonify(result), 200  # Return the result of user creation
+        result = get_scanner().create_user(name=name, password=password, role_ids=role_ids)  # Create user
+        invalidate_lists('get_users')  # The user list changed
+        return ojson(result)  # Return the result of user creation
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400  # Return error if user creation fails
+        return ojson({"error": str(e)}, 400)  # Return error if user creation fails
 
 
 
@@ -148,16 +253,17 @@ def modify_user(user_id):
     Requires admin privileges to execute.
     Returns the result of the user modification operation.
     """
-    data = request.json  # Get JSON data from the request
+    data = request.get_json()  # Get JSON data from the request
     new_username = data.get('name')  # Extract the new username
     new_password = data.get('password')  # Extract the new password
     new_roles = data.get('role_ids', [])  # Extract new role IDs, defaulting to an empty list
     
     try:
-        result = scanner.modify_user(user_id=user_id, new_username=new_username, new_password=new_password, role_ids=new_roles)  # Modify user
-        return jsonify(result), 200  # Return the result of user modification
+        result = get_scanner().modify_user(user_id=user_id, new_username=new_username, new_password=new_password, role_ids=new_roles)  # Modify user
+        invalidate_lists('get_users')  # The user list changed
+        return ojson(result)  # Return the result of user modification
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400  # Return error if user modification fails
+        return ojson({"error": str(e)}, 400)  # Return error if user modification fails
 
 
 @scanner_bp.route('/delete_user/<user_id>', methods=['DELETE'])
@@ -169,10 +275,11 @@ def delete_user(user_id):
     Returns the result of the user deletion operation.
     """
     try:
-        result = scanner.delete_user(user_id=user_id)  # Delete user
-        return jsonify(result), 200  # Return the result of user deletion
+        result = get_scanner().delete_user(user_id=user_id)  # Delete user
+        invalidate_lists('get_users')  # The user list changed
+        return ojson(result)  # Return the result of user deletion
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400  # Return error if user deletion fails
+        return ojson({"error": str(e)}, 400)  # Return error if user deletion fails
 
 
 
@@ -187,7 +294,7 @@ def clone_user(user_id):
     Returns the result of the cloning operation.
     """
     # Retrieve JSON data from the request
-    data = request.json
+    data = request.get_json()
     
     # Extract optional fields for modification
     new_name = data.get('name', None)  # New name for the cloned user, if provided
@@ -196,10 +303,11 @@ def clone_user(user_id):
     
     try:
         # Call the clone_user method with optional parameters
-        result = scanner.clone_user(user_id=user_id, name=new_name, comment=new_comment, roles=new_roles)
-        return jsonify(result), 200  # Return the result of cloning the user
+        result = get_scanner().clone_user(user_id=user_id, name=new_name, comment=new_comment, roles=new_roles)
+        invalidate_lists('get_users')  # The user list changed
+        return ojson(result)  # Return the result of cloning the user
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400  # Return error if cloning fails
+        return ojson({"error": str(e)}, 400)  # Return error if cloning fails
 
 
 @scanner_bp.route('/get_scanners', methods=['GET'])
@@ -211,12 +319,15 @@ def get_scanners():
     Returns a formatted list of scanners as key-value pairs.
     """
     try:
-        scanners = scanner.get_scanners()  # Retrieve scanners from the OpenVAS
-        # Refactor output to key-value pairs
-        formatted_scanners = [{"id": scanner[0], "name": scanner[1]} for scanner in scanners]  # Format scanner data
-        return jsonify(formatted_scanners), 200  # Return formatted scanners
+        def load_scanners():
+            scanners = get_scanner().get_scanners()  # Retrieve scanners from the OpenVAS
+            # Refactor output to key-value pairs
+            return [{"id": scanner_id, "name": scanner_name} for scanner_id, scanner_name in scanners]  # Format scanner data
+
+        formatted_scanners = cached_list('get_scanners', load_scanners)
+        return ojson(formatted_scanners)  # Return formatted scanners
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500  # Return error if retrieval fails
+        return ojson({"error": str(e)}, 500)  # Return error if retrieval fails
 
 
 @scanner_bp.route('/get_configs', methods=['GET'])
@@ -228,15 +339,19 @@ def get_configs():
     Returns a list of configurations with their IDs and names.
     """
     try:
-        configs = scanner.get_configs()  # Retrieve configurations from the OpenVAS
-        config_list = []  # Initialize a list to store formatted config data
-        for config in configs:
-            config_id = config.xpath('@id')[0]  # Extract the config ID
-            config_name = config.xpath('name/text()')[0]  # Extract the config name
-            config_list.append({"config_id": config_id, "config_name": config_name})  # Add to the list
-        return jsonify(config_list), 200  # Return the list of configurations
+        def load_configs():
+            configs = get_scanner().get_configs()  # Retrieve configurations from the OpenVAS
+            config_list = []  # Initialize a list to store formatted config data
+            for config in configs:
+                config_id = config.get('id')  # Extract the config ID
+                config_name = config.findtext('name')  # Extract the config name
+                config_list.append({"config_id": config_id, "config_name": config_name})  # Add to the list
+            return config_list
+
+        config_list = cached_list('get_configs', load_configs)
+        return ojson(config_list)  # Return the list of configurations
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500  # Return error if retrieval fails
+        return ojson({"error": str(e)}, 500)  # Return error if retrieval fails
 
 
 @scanner_bp.route('/get_portlists', methods=['GET'])
@@ -248,10 +363,10 @@ def get_portlists():
     Returns a list of port lists.
     """
     try:
-        portlists = scanner.get_portlists()  # Retrieve port lists from the OpenVAS
-        return jsonify({"portlists": portlists}), 200  # Return port lists
+        portlists = cached_list('get_portlists', get_scanner().get_portlists)  # Retrieve port lists from the OpenVAS
+        return ojson({"portlists": portlists})  # Return port lists
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500  # Return error if retrieval fails
+        return ojson({"error": str(e)}, 500)  # Return error if retrieval fails
 
 
 @scanner_bp.route('/get_hosts', methods=['GET'])
@@ -263,10 +378,10 @@ def get_hosts():
     Returns a list of hosts.
     """
     try:
-        hosts = scanner.get_hosts()  # Retrieve hosts from the OpenVAS
-        return jsonify({"hosts": hosts}), 200  # Return the list of hosts
+        hosts = get_scanner().get_hosts()  # Retrieve hosts from the OpenVAS
+        return ojson({"hosts": hosts})  # Return the list of hosts
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500  # Return error if retrieval fails
+        return ojson({"error": str(e)}, 500)  # Return error if retrieval fails
 
 
 @scanner_bp.route('/delete_host/<host_id>', methods=['DELETE'])
@@ -283,10 +398,10 @@ def delete_host(host_id):
         JSON response with the result of the deletion.
     """
     try:
-        result = scanner.delete_host(host_id=host_id)  # Attempt to delete the host by ID
-        return jsonify(result), 200  # Return the result of the deletion
+        result = get_scanner().delete_host(host_id=host_id)  # Attempt to delete the host by ID
+        return ojson(result)  # Return the result of the deletion
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500  # Return error if deletion fails
+        return ojson({"error": str(e)}, 500)  # Return error if deletion fails
 
 
 @scanner_bp.route('/convert_hosts_to_targets', methods=['POST'])
@@ -309,41 +424,50 @@ def convert_hosts_to_targets():
     Returns:
         JSON response containing the list of created targets.
     """
-    data = request.json  # Retrieve JSON data from the request
-    hosts = data.get('hosts', [])  # Extract the list of hosts
-    port_list_id = data.get('port_list_id', None)  # Extract the port list ID
-    port_range = data.get('port_range', None)  # Extract the port range
-
-    created_targets = []  # Initialize a list to store created targets
+    # Validate the body (including an IP for every host) up front so a bad entry doesn't leave earlier targets half-created
+    req = load_request(ConvertHostsRequest)
+    port_list_id = req.port_list_id  # Extract the port list ID
+    port_range = req.port_range  # Extract the port range
 
     # Fetch existing targets
-    existing_targets = scanner.get_targets()  # Retrieve existing targets from the OpenVAS
-    existing_target_names = {target.findtext('name') for target in existing_targets}  # Create a set of existing target names
-
-    for host in hosts:
-        # Extract hostname and IP
-        hostname = host.get('hostname')  # Get the hostname from the host data
-        ip = host.get('ip')  # Get the IP address from the host data
-
-        if not ip:
-            return jsonify({"error": "IP address is required for each host"}), 400  # Return error if IP is missing
-
+    existing_targets = get_scanner().get_targets()  # Retrieve existing targets from the OpenVAS
+    # Normalize existing names so "Host-A " and "host-a" count as the same target
+    existing_target_names = frozenset((target['name'] or '').strip().lower() for target in existing_targets)
+
+    pending_targets = []  # (target name, IP) pairs that still need a target
+    pending_names = set()  # Normalized names already queued, so duplicates in the request are created once
+    for host in req.hosts:
+        ip = host.ip  # Get the IP address from the host data
         # Use hostname if available, otherwise use IP as the target name
-        target_name = hostname if hostname else ip
+        target_name = host.hostname or ip
+        normalized_name = target_name.strip().lower()
 
         # Skip creating the target if it already exists
-        if target_name in existing_target_names:
+        if normalized_name in existing_target_names or normalized_name in pending_names:
             continue  # Skip to the next host if the target already exists
+        pending_names.add(normalized_name)
+        pending_targets.append((target_name, ip))
 
+    created_targets = []  # Initialize a list to store created targets
+    append_created = created_targets.append  # Bind once for the collection loop
+
+    scanner_create_target = get_scanner().create_target  # Resolve the bound method once for all submissions
+    # Create the targets concurrently so the OpenVAS round-trips overlap
+    with ThreadPoolExecutor(max_workers=TARGET_CREATE_WORKERS) as executor:
+        futures = [
+            executor.submit(scanner_create_target, name=target_name, hosts=ip, port_list_id=port_list_id, port_range=port_range)
+            for target_name, ip in pending_targets
+        ]
         try:
-            # Create target with the extracted name and IP
-            target_id = scanner.create_target(name=target_name, hosts=ip, port_list_id=port_list_id, port_range=port_range)
-            created_targets.append({"target_name": target_name, "target_id": target_id})  # Add created target to the list
+            for (target_name, _), future in zip(pending_targets, futures):
+                append_created({"target_name": target_name, "target_id": future.result()})  # Add created target to the list
         except ValueError as e:
             # Return the detailed error message
-            return jsonify({"error": str(e)}), 500  # Return error if target creation fails
+            return ojson({"error": str(e)}, 500)  # Return error if target creation fails
+        finally:
+            invalidate_lists('get_targets')  # Some targets may have been created even on failure
 
-    return jsonify({"created_targets": created_targets}), 201  # Return the list of created targets
+    return ojson({"created_targets": created_targets}, 201)  # Return the list of created targets
 
 
 
@@ -358,10 +482,10 @@ def get_targets():
         JSON response containing the list of targets.
     """
     try:
-        targets = scanner.get_targets()  # Call the method to retrieve targets
-        return jsonify(targets), 200  # Return the list of targets as JSON
+        targets = cached_list('get_targets', get_scanner().get_targets)  # Call the method to retrieve targets
+        return ojson(targets)  # Return the list of targets as JSON
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500  # Return error if retrieval fails
+        return ojson({"error": str(e)}, 500)  # Return error if retrieval fails
 
 
 @scanner_bp.route('/create_target', methods=['POST'])
@@ -383,25 +507,29 @@ def create_target():
     Returns:
         JSON response containing the ID of the created target.
     """
-    data = request.json  # Retrieve JSON data from the request
-    name = data.get('name')  # Extract the target name
-    hosts = data.get('hosts')  # Extract the hosts
-    port_range = data.get('port_range')  # Extract the port range
-    port_list_id = data.get('port_list_id')  # Extract the port list ID
-    comment = data.get('comment')  # Extract the optional comment
-
-    if not name or not hosts:
-        return jsonify({"error": "Name and hosts are required."}), 400  # Return error if required fields are missing
+    req = load_request(CreateTargetRequest)  # Parse and validate the JSON body; name and hosts are required
+    name = req.name  # Extract the target name
+    hosts = req.hosts  # Extract the hosts
+    port_range = req.port_range  # Extract the port range
+    port_list_id = req.port_list_id  # Extract the port list ID
+    comment = req.comment  # Extract the optional comment
 
     # Split hosts by comma and strip whitespace
-    hosts_list = [host.strip() for host in hosts.split(',')] if isinstance(hosts, str) else hosts  # Prepare the hosts list
+    if isinstance(hosts, str):
+        hosts = hosts.strip()
+        if not _HOSTS_VALID.fullmatch(hosts):
+            return ojson({"error": "Invalid hosts list."}, 400)  # Reject malformed hosts before calling OpenVAS
+        hosts_list = _HOSTS_SPLIT.split(hosts)  # Prepare the hosts list
+    else:
+        hosts_list = hosts
 
     try:
         # Create the target using the provided parameters
-        target_id = scanner.create_target(name=name, hosts=hosts_list, port_range=port_range, port_list_id=port_list_id, comment=comment)
-        return jsonify({"target_id": target_id}), 201  # Return the ID of the created target
+        target_id = get_scanner().create_target(name=name, hosts=hosts_list, port_range=port_range, port_list_id=port_list_id, comment=comment)
+        invalidate_lists('get_targets')  # The target list changed
+        return ojson({"target_id": target_id}, 201)  # Return the ID of the created target
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400  # Return error if creation fails
+        return ojson({"error": str(e)}, 400)  # Return error if creation fails
 
 
 
@@ -420,10 +548,11 @@ def delete_target(target_id):
         JSON response indicating the result of the deletion.
     """
     try:
-        result = scanner.delete_target(target_id=target_id)  # Call the method to delete the target
-        return jsonify(result), 200  # Return the result of the deletion
+        result = get_scanner().delete_target(target_id=target_id)  # Call the method to delete the target
+        invalidate_lists('get_targets')  # The target list changed
+        return ojson(result)  # Return the result of the deletion
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500  # Return error if deletion fails
+        return ojson({"error": str(e)}, 500)  # Return error if deletion fails
 
 
 @scanner_bp.route('/modify_target/<string:target_id>', methods=['POST'])
@@ -448,19 +577,25 @@ def modify_target(target_id):
     Returns:
         JSON response containing the result of the modification.
     """
-    data = request.json  # Retrieve JSON data from the request
+    req = load_request(ModifyTargetRequest)  # Parse and validate the JSON body
     try:
-        name = data.get('name')  # Extract the new target name
-        hosts = data.get('hosts')  # Extract the new hosts
-        exclude_hosts = data.get('exclude_hosts')  # Extract the excluded hosts
-        port_list_id = data.get('port_list_id')  # Extract the new port list ID
-        comment = data.get('comment')  # Extract the optional comment
+        name = req.name  # Extract the new target name
+        hosts = req.hosts  # Extract the new hosts
+        exclude_hosts = req.exclude_hosts  # Extract the excluded hosts
+        port_list_id = req.port_list_id  # Extract the new port list ID
+        comment = req.comment  # Extract the optional comment
 
         # Split hosts by comma and strip whitespace
-        hosts_list = [host.strip() for host in hosts.split(',')] if isinstance(hosts, str) else hosts  # Prepare the hosts list
+        if isinstance(hosts, str):
+            hosts = hosts.strip()
+            if not _HOSTS_VALID.fullmatch(hosts):
+                return ojson({"error": "Invalid hosts list."}, 400)  # Reject malformed hosts before calling OpenVAS
+            hosts_list = _HOSTS_SPLIT.split(hosts)  # Prepare the hosts list
+        else:
+            hosts_list = hosts
 
         # Call the method to modify the target with the provided parameters
-        result = scanner.modify_target(
+        result = get_scanner().modify_target(
             target_id=target_id,
             name=name,
             hosts=hosts_list,
@@ -468,11 +603,12 @@ def modify_target(target_id):
             port_list_id=port_list_id,
             comment=comment
         )
+        invalidate_lists('get_targets')  # The target list changed
 
-        return jsonify(result), 200  # Return the result of the modification
+        return ojson(result)  # Return the result of the modification
 
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500  # Return error if modification fails
+        return ojson({"error": str(e)}, 500)  # Return error if modification fails
 
 
 
@@ -498,17 +634,17 @@ def create_task():
     Returns:
         JSON response containing the ID of the created task.
     """
-    data = request.json  # Retrieve JSON data from the request
-    name = data.get('name')  # Extract the task name
-    target_id = data.get('target_id')  # Extract the target ID for the task
-    config_id = data.get('config_id')  # Extract the configuration ID for the task
-    scanner_id = data.get('scanner_id')  # Extract the scanner ID
-    schedule_id = data.get('schedule_id', None)  # Extract the optional schedule ID
-    alert_ids = data.get('alert_ids', None)  # Extract the optional alert IDs
+    req = load_request(CreateTaskRequest)  # Parse and validate the JSON body
+    name = req.name  # Extract the task name
+    target_id = req.target_id  # Extract the target ID for the task
+    config_id = req.config_id  # Extract the configuration ID for the task
+    scanner_id = req.scanner_id  # Extract the scanner ID
+    schedule_id = req.schedule_id  # Extract the optional schedule ID
+    alert_ids = req.alert_ids  # Extract the optional alert IDs
     
     try:
         # Call the method to create the task with the provided parameters
-        task_id = scanner.create_task(
+        task_id = get_scanner().create_task(
             name=name,
             target_id=target_id,
             config_id=config_id,
@@ -516,9 +652,9 @@ def create_task():
             schedule_id=schedule_id,
             alert_ids=alert_ids
         )
-        return jsonify({"task_id": task_id}), 201  # Return the ID of the created task
+        return ojson({"task_id": task_id}, 201)  # Return the ID of the created task
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500  # Return error if task creation fails
+        return ojson({"error": str(e)}, 500)  # Return error if task creation fails
 
 
 @scanner_bp.route('/start_task/<task_id>', methods=['POST'])
@@ -533,10 +669,10 @@ def start_task(task_id):
         JSON response: A success message with the response from starting the task, or an error message if a ValueError occurs.
     """
     try:
-        response = scanner.start_task(task_id=task_id)
-        return jsonify(response), 200
+        response = get_scanner().start_task(task_id=task_id)
+        return ojson(response)
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500
+        return ojson({"error": str(e)}, 500)
     
 
 @scanner_bp.route('/stop_task/<task_id>', methods=['POST'])
@@ -551,10 +687,10 @@ def stop_task(task_id):
         JSON response: A success message with the response from stopping the task, or an error message if a ValueError occurs.
     """
     try:
-        response = scanner.stop_task(task_id=task_id)
-        return jsonify(response), 200
+        response = get_scanner().stop_task(task_id=task_id)
+        return ojson(response)
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500
+        return ojson({"error": str(e)}, 500)
     
 
 @scanner_bp.route('/resume_task/<task_id>', methods=['POST'])
@@ -569,10 +705,10 @@ def resume_task(task_id):
         JSON response: A success message with the response from resuming the task, or an error message if a ValueError occurs.
     """
     try:
-        response = scanner.resume_task(task_id=task_id)
-        return jsonify(response), 200
+        response = get_scanner().resume_task(task_id=task_id)
+        return ojson(response)
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500
+        return ojson({"error": str(e)}, 500)
 
 
 @scanner_bp.route('/delete_task/<task_id>', methods=['DELETE'])
@@ -587,13 +723,13 @@ def delete_task(task_id):
         JSON response: A success message with the result of the deletion, or an error message if a ValueError occurs (400) or any other unexpected error (500).
     """
     try:
-        result = scanner.delete_task(task_id)
-        return jsonify(result), 200
+        result = get_scanner().delete_task(task_id)
+        return ojson(result)
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400
+        return ojson({"error": str(e)}, 400)
     except Exception as e:
         # Handle unexpected errors
-        return jsonify({"error": "An unexpected error occurred", "details": str(e)}), 500
+        return ojson({"error": "An unexpected error occurred", "details": str(e)}, 500)
 
 
 @scanner_bp.route('/modify_task/<task_id>', methods=['PUT'])
@@ -608,18 +744,18 @@ def modify_task(task_id):
     Returns:
         JSON response: A success message with the result of the modification, or an error message if a ValueError occurs (500).
     """
-    data = request.json
-    name = data.get('name')
-    config_id = data.get('config_id')
-    scanner_id = data.get('scanner_id')
-    schedule_id = data.get('schedule_id')
-    alert_ids = data.get('alert_ids')
+    req = load_request(ModifyTaskRequest)
+    name = req.name
+    config_id = req.config_id
+    scanner_id = req.scanner_id
+    schedule_id = req.schedule_id
+    alert_ids = req.alert_ids
     
     try:
-        result = scanner.modify_task(task_id=task_id, name=name, config_id=config_id, scanner_id=scanner_id, schedule_id=schedule_id, alert_ids=alert_ids)
-        return jsonify(result), 200
+        result = get_scanner().modify_task(task_id=task_id, name=name, config_id=config_id, scanner_id=scanner_id, schedule_id=schedule_id, alert_ids=alert_ids)
+        return ojson(result)
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500
+        return ojson({"error": str(e)}, 500)
 
 
 @scanner_bp.route('/get_task/<task_id>', methods=['GET'])
@@ -634,15 +770,15 @@ def get_task(task_id):
         JSON response: A success message with the task information, or an error message if task_id is not provided (400), a ValueError occurs (400), or any other unexpected error (500).
     """
     if not task_id:
-        return jsonify({"status": "error", "message": "task_id is required"}), 400
+        return ojson({"status": "error", "message": "task_id is required"}, 400)
 
     try:
-        response = scanner.get_task(task_id)
-        return jsonify(response), 200
+        response = get_scanner().get_task(task_id)
+        return ojson(response)
     except ValueError as e:
-        return jsonify({"status": "error", "message": str(e)}), 400
+        return ojson({"status": "error", "message": str(e)}, 400)
     except Exception as e:
-        return jsonify({"status": "error", "message": "An unexpected error occurred"}), 500
+        return ojson({"status": "error", "message": "An unexpected error occurred"}, 500)
 
 
 @scanner_bp.route('/get_task_status/<task_id>', methods=['GET'])
@@ -654,15 +790,24 @@ def get_task_status(task_id):
         task_id (str): The ID of the task for which to retrieve the status.
 
     Returns:
-        JSON response: A success message with the task status, or an error message if the task is not found (404) or if a ValueError occurs (500).
+        JSON response: A success message with the task status, 304 if it matches the client's If-None-Match ETag,
+        or an error message if the task is not found (404) or if a ValueError occurs (500).
     """
     try:
-        response = scanner.get_task_status(task_id=task_id)
-        if response is None:
-            return jsonify({"error": "Task not found or no status available."}), 404
-        return jsonify(response), 200
+        with task_status_cache_lock:
+            cached = task_status_cache.get(task_id)
+        if cached is None:
+            response = get_scanner().get_task_status(task_id=task_id)
+            if response is None:
+                return ojson({"error": "Task not found or no status available."}, 404)
+            body = orjson.dumps(response, option=orjson.OPT_SORT_KEYS)  # Stable key order so equal statuses hash equally
+            cached = (body, hashlib.blake2b(body, digest_size=8).hexdigest())
+            with task_status_cache_lock:
+                task_status_cache[task_id] = cached
+
+        return conditional_json(*cached)
     except ValueError as e:
-        return jsonify({"error": "Failed to retrieve task status.", "details": str(e)}), 500
+        return ojson({"error": "Failed to retrieve task status.", "details": str(e)}, 500)
 
 
 
@@ -676,10 +821,10 @@ def get_tasks():
         JSON response: A success message containing the list of tasks, or an error message if a ValueError occurs (500).
     """
     try:
-        tasks = scanner.get_tasks()
-        return jsonify({"tasks": tasks}), 200
+        tasks = get_scanner().get_tasks()
+        return ojson({"tasks": tasks})
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500
+        return ojson({"error": str(e)}, 500)
 
 
 @scanner_bp.route('/get_results', methods=['POST'])
@@ -693,14 +838,14 @@ def get_results():
     Returns:
         JSON response: A success message containing the results for the specified task, or an error message if a ValueError occurs (500).
     """
-    data = request.json
+    data = request.get_json()
     task_id = data.get('task_id')
     
     try:
-        results = scanner.get_results(task_id=task_id)
-        return jsonify({"results": results}), 200
+        results = get_scanner().get_results(task_id=task_id)
+        return ojson({"results": results})
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500
+        return ojson({"error": str(e)}, 500)
 
 
 @scanner_bp.route('/get_reports', methods=['GET'])
@@ -712,10 +857,10 @@ def get_reports():
         JSON response: A success message containing the list of reports, or an error message if a ValueError occurs (500).
     """
     try:
-        reports = scanner.get_reports()
-        return jsonify({"reports": reports}), 200
+        reports = cached_list('get_reports', get_scanner().get_reports)
+        return ojson({"reports": reports})
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500
+        return ojson({"error": str(e)}, 500)
 
 
 
@@ -730,10 +875,10 @@ def get_report(report_id):
     Returns:
         JSON response: The report data if found, or an error message if the report cannot be found (404).
     """
-    report_data = scanner.get_report_by_id(report_id)
+    report_data = get_scanner().get_report_by_id(report_id)
     if "error" in report_data:
-        return jsonify(report_data), 404
-    return jsonify(report_data), 200
+        return ojson(report_data, 404)
+    return ojson(report_data)
 
 
 @scanner_bp.route('/get_reports_with_tasks', methods=['GET'])
@@ -745,10 +890,10 @@ def get_reports_with_tasks():
         JSON response: A success message containing the reports with tasks, or an error message if a ValueError occurs (500).
     """
     try:
-        reports_with_tasks = scanner.get_reports_with_tasks()
-        return jsonify({"reports": reports_with_tasks}), 200
+        reports_with_tasks = get_scanner().get_reports_with_tasks()
+        return ojson({"reports": reports_with_tasks})
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500
+        return ojson({"error": str(e)}, 500)
 
 
 @scanner_bp.route('/delete_report/<report_id>', methods=['DELETE'])
@@ -763,10 +908,11 @@ def delete_report(report_id):
         JSON response: A success message with the result of the deletion, or an error message if a ValueError occurs (400).
     """
     try:
-        result = scanner.delete_report(report_id=report_id)
-        return jsonify(result), 200
+        result = get_scanner().delete_report(report_id=report_id)
+        invalidate_lists('get_reports')  # The report list changed
+        return ojson(result)
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400
+        return ojson({"error": str(e)}, 400)
 
     
 
@@ -783,24 +929,27 @@ def export_report(report_id, format):
         Response: A file attachment of the exported report if successful, or an error message if the report cannot be found (404), unsupported format (400), or a ValueError occurs (500).
     """
     try:
+        scanner = get_scanner()  # Look the scanner up once for the fetch and the export
         report_data = scanner.get_report_by_id(report_id)
         if "error" in report_data:
-            return jsonify(report_data), 404
+            return ojson(report_data, 404)
 
         filename = f"report_{report_id}.{format}"
+        buffer = io.BytesIO()  # Build the export in memory instead of on disk
         if format == 'csv':
-            filepath = scanner.export_report_to_csv(report_data, filename)
+            scanner.export_report_to_csv(report_data, buffer)
         elif format == 'xlsx':
-            filepath = scanner.export_report_to_excel(report_data, filename)
+            scanner.export_report_to_excel(report_data, buffer)
         elif format == 'pdf':
-            filepath = scanner.export_report_to_pdf(report_data, filename)
+            scanner.export_report_to_pdf(report_data, buffer)
         else:
-            return jsonify({"error": "Unsupported format"}), 400
+            return ojson({"error": "Unsupported format"}, 400)
 
-        return send_file(filepath, as_attachment=True)
+        buffer.seek(0)  # Rewind so send_file reads from the start
+        return send_file(buffer, as_attachment=True, download_name=filename, mimetype=EXPORT_MIMETYPES[format])
 
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500
+        return ojson({"error": str(e)}, 500)
 
 
 @scanner_bp.route('/get_schedules', methods=['GET'])
@@ -812,11 +961,11 @@ def get_schedules():
         JSON response: A success message containing the list of schedules, or an error message if a ValueError occurs (500).
     """
     try:
-        schedules = scanner.get_schedules()
+        schedules = cached_list('get_schedules', get_scanner().get_schedules)
         # Process the schedules if needed. Assuming `schedules` is already in a dictionary format.
-        return jsonify({"schedules": schedules}), 200
+        return ojson({"schedules": schedules})
     except ValueError as e:
-        return jsonify({"error": str(e)}), 500
+        return ojson({"error": str(e)}, 500)
 
 
 
@@ -837,49 +986,28 @@ def create_schedule():
     Returns:
         JSON response: A success message containing the newly created schedule ID (201).
     """
-    data = request.json
-    name = data['name']
-    dtstart = datetime.strptime(data['dtstart'], '%Y-%m-%dT%H:%M:%S')
-    timezone = data.get('timezone', 'UTC')
-    comment = data.get('comment', '')
-    frequency = data.get('frequency', 'daily')  # Default to daily
-    interval = data.get('interval', 1)  # Default interval to 1
-    count = data.get('count')  # Optional: number of occurrences
+    req = load_request(CreateScheduleRequest)  # Parse and validate the JSON body, including dtstart and the recurrence
+    name = req.name
+    dtstart = req.dtstart
+    timezone = req.timezone
+    comment = req.comment
+    frequency = req.frequency  # Default to daily
+    interval = req.interval  # Default interval to 1
+    count = req.count  # Optional: number of occurrences
 
     # Create the iCalendar data
-    cal = Calendar()
-    cal.add('prodid', '-//VulunScan//')
-    cal.add('version', '2.0')
-
-    event = Event()
-    event.add('dtstamp', datetime.now(tz=pytz.UTC))
-    event.add('dtstart', dtstart)
-
-    # Define recurrence rule based on frequency
-    rrule_params = {
-        'freq': frequency,
-        'interval': interval
-    }
-    if count:
-        rrule_params['count'] = count
-
-    event.add('rrule', rrule_params)
-
-    # Add the event to the calendar
-    cal.add_component(event)
-
-    # Convert the calendar to iCalendar format
-    icalendar_data = cal.to_ical().decode()
+    icalendar_data = make_icalendar(dtstart, frequency, interval, count)
 
     # Create the schedule using the simplified method
-    schedule_id = scanner.create_schedule(
+    schedule_id = get_scanner().create_schedule(
         name=name,
         icalendar_data=icalendar_data,
         timezone=timezone,
         comment=comment
     )
+    invalidate_lists('get_schedules')  # The schedule list changed
 
-    return jsonify({"schedule_id": schedule_id}), 201
+    return ojson({"schedule_id": schedule_id}, 201)
 
 
 @scanner_bp.route('/modify_schedule', methods=['POST'])
@@ -900,51 +1028,30 @@ def modify_schedule():
     Returns:
         JSON response: A success message indicating the schedule was modified (200).
     """
-    data = request.json
-    schedule_id = data['schedule_id']
-    name = data['name']
-    dtstart = datetime.strptime(data['dtstart'], '%Y-%m-%dT%H:%M:%S')
-    timezone = data.get('timezone')
-    comment = data.get('comment')
-    frequency = data.get('frequency')  
-    interval = data.get('interval')  
-    count = data.get('count')  # Optional: number of occurrences
+    req = load_request(ModifyScheduleRequest)  # Parse and validate the JSON body, including dtstart and the recurrence
+    schedule_id = req.schedule_id
+    name = req.name
+    dtstart = req.dtstart
+    timezone = req.timezone
+    comment = req.comment
+    frequency = req.frequency  # Default to daily
+    interval = req.interval  # Default interval to 1
+    count = req.count  # Optional: number of occurrences
 
     # Create the iCalendar data
-    cal = Calendar()
-    cal.add('prodid', '-//VulunScan//')
-    cal.add('version', '2.0')
-
-    event = Event()
-    event.add('dtstamp', datetime.now(tz=pytz.UTC))
-    event.add('dtstart', dtstart)
-
-    # Define recurrence rule based on frequency
-    rrule_params = {
-        'freq': frequency,
-        'interval': interval
-    }
-    if count:
-        rrule_params['count'] = count
-
-    event.add('rrule', rrule_params)
-
-    # Add the event to the calendar
-    cal.add_component(event)
-
-    # Convert the calendar to iCalendar format
-    icalendar_data = cal.to_ical().decode()
+    icalendar_data = make_icalendar(dtstart, frequency, interval, count)
 
     # Modify the schedule using the modified method
-    scanner.modify_schedule(
+    get_scanner().modify_schedule(
         schedule_id=schedule_id,
         name=name,
         icalendar_data=icalendar_data,
         timezone=timezone,
         comment=comment
     )
+    invalidate_lists('get_schedules')  # The schedule list changed
 
-    return jsonify({"message": "Schedule modified successfully"}), 200
+    return ojson({"message": "Schedule modified successfully"})
 
 
 @scanner_bp.route('/delete_schedule/<schedule_id>', methods=['DELETE'])
@@ -961,10 +1068,11 @@ def delete_schedule(schedule_id):
         JSON response: The result of the deletion (200) or an error message (400) if the schedule cannot be found or deleted.
     """
     try:
-        result = scanner.delete_schedule(schedule_id=schedule_id)
-        return jsonify(result), 200
+        result = get_scanner().delete_schedule(schedule_id=schedule_id)
+        invalidate_lists('get_schedules')  # The schedule list changed
+        return ojson(result)
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400
+        return ojson({"error": str(e)}, 400)
 
 
 
@@ -978,20 +1086,20 @@ def create_alert():
     Returns:
         JSON response: Success message with alert ID (201) or an error message (500) if the creation fails.
     """
+    req = load_request(CreateAlertRequest)  # Parse and validate the JSON body before talking to OpenVAS
     try:
-        data = request.json
-        name = data.get('name')  # The name of the alert
-        condition = data.get('condition')  # Condition for the alert
-        event = data.get('event')  # Event that triggers the alert
-        method = data.get('method')  # Method of notification
-        condition_data = data.get('condition_data', {})  # Additional data for the condition
-        event_data = data.get('event_data', {})  # Additional data for the event
-        method_data = data.get('method_data', {})  # Additional data for the method
-        filter_id = data.get('filter_id')  # Optional filter ID for the alert
-        comment = data.get('comment')  # Optional comment for the alert
+        name = req.name  # The name of the alert
+        condition = req.condition  # Condition for the alert
+        event = req.event  # Event that triggers the alert
+        method = req.method  # Method of notification
+        condition_data = req.condition_data  # Additional data for the condition
+        event_data = req.event_data  # Additional data for the event
+        method_data = req.method_data  # Additional data for the method
+        filter_id = req.filter_id  # Optional filter ID for the alert
+        comment = req.comment  # Optional comment for the alert
 
         # Create the alert using the OpenVAS scanner's method
-        alert_response = scanner.create_alert(
+        alert_response = get_scanner().create_alert(
             name=name,
             condition=condition,
             event=event,
@@ -1002,18 +1110,19 @@ def create_alert():
             filter_id=filter_id,
             comment=comment
         )
+        invalidate_lists('get_alerts')  # The alert list changed
 
-        return jsonify({
+        return ojson({
             "status": "success",
             "message": "Alert created successfully.",
             "alert_id": alert_response.get('id')  # Return the ID of the created alert
-        }), 201
+        }, 201)
 
-    except Exception as e:
-        return jsonify({
+    except ValueError as e:
+        return ojson({
             "status": "error",
             "message": f"Failed to create alert: {str(e)}"  # Return error message on failure
-        }), 500
+        }, 500)
 
     
 
@@ -1026,12 +1135,14 @@ def get_alerts():
         JSON response: List of alerts (200) or error messages (400/500) in case of failure.
     """
     try:
-        alerts = scanner.get_alerts()  # Fetch the alerts using the scanner's method
-        return jsonify(alerts), 200  # Return the alerts with a 200 status
+        def load_alerts():
+            body = orjson.dumps(get_scanner().get_alerts())  # Fetch the alerts using the scanner's method
+            return body, hashlib.blake2b(body, digest_size=16).hexdigest()
+
+        # The serialized alerts and their ETag are cached together, so repeat polls skip serialization
+        return conditional_json(*cached_list('get_alerts', load_alerts))
     except ValueError as e:
-        return jsonify({"status": "error", "message": str(e)}), 400  # Handle value errors with a 400 status
-    except Exception as e:
-        return jsonify({"status": "error", "message": "An unexpected error occurred"}), 500  # Handle unexpected errors with a 500 status
+        return ojson({"status": "error", "message": str(e)}, 400)  # Handle value errors with a 400 status
 
 
 
@@ -1043,30 +1154,26 @@ def modify_alert():
     Returns:
         JSON response: Details of the modified alert (200) or error messages (400/500) in case of failure.
     """
-    data = request.json  # Get the JSON data from the request
-    alert_id = data.get('alert_id')  # Retrieve alert_id from the request data
-    if not alert_id:  # Check if alert_id is provided
-        return jsonify({"status": "error", "message": "alert_id is required"}), 400  # Respond with an error if missing
+    req = load_request(ModifyAlertRequest)  # Parse and validate the JSON body; alert_id is required
 
     try:
         # Call the scanner's method to modify the alert with the provided data
-        response = scanner.modify_alert(
-            alert_id=alert_id,
-            name=data.get('name'),
-            condition=data.get('condition'),
-            event=data.get('event'),
-            method=data.get('method'),
-            condition_data=data.get('condition_data'),
-            event_data=data.get('event_data'),
-            method_data=data.get('method_data'),
-            filter_id=data.get('filter_id'),
-            comment=data.get('comment')
+        response = get_scanner().modify_alert(
+            alert_id=req.alert_id,
+            name=req.name,
+            condition=req.condition,
+            event=req.event,
+            method=req.method,
+            condition_data=req.condition_data,
+            event_data=req.event_data,
+            method_data=req.method_data,
+            filter_id=req.filter_id,
+            comment=req.comment
         )
-        return jsonify(response), 200  # Return the modified alert details with a 200 status
+        invalidate_lists('get_alerts')  # The alert list changed
+        return ojson(response)  # Return the modified alert details with a 200 status
     except ValueError as e:
-        return jsonify({"status": "error", "message": str(e)}), 400  # Handle value errors with a 400 status
-    except Exception as e:
-        return jsonify({"status": "error", "message": "An unexpected error occurred"}), 500  # Handle unexpected errors with a 500 status
+        return ojson({"status": "error", "message": str(e)}, 400)  # Handle value errors with a 400 status
 
 
 @scanner_bp.route('/delete_alert/<alert_id>', methods=['DELETE'])
@@ -1081,14 +1188,80 @@ def delete_alert(alert_id):
         JSON response: Status message indicating the result of the deletion (200) or error messages (400/500) in case of failure.
     """
     if not alert_id:  # Check if alert_id is provided
-        return jsonify({"status": "error", "message": "alert_id is required"}), 400  # Respond with an error if missing
+        return ojson({"status": "error", "message": "alert_id is required"}, 400)  # Respond with an error if missing
 
     try:
         # Call the scanner's method to delete the alert using the provided alert_id
-        response = scanner.delete_alert(alert_id=alert_id)
-        return jsonify(response), 200  # Return the response indicating successful deletion with a 200 status
+        response = get_scanner().delete_alert(alert_id=alert_id)
+        invalidate_lists('get_alerts')  # The alert list changed
+        return ojson(response)  # Return the response indicating successful deletion with a 200 status
     except ValueError as e:
-        return jsonify({"status": "error", "message": str(e)}), 400  # Handle value errors with a 400 status
-    except Exception as e:
-        return jsonify({"status": "error", "message": "An unexpected error occurred"}), 500  # Handle unexpected errors with a 500 status
+        return ojson({"status": "error", "message": str(e)}, 400)  # Handle value errors with a 400 status
+
+
+@scanner_bp.route('/create_alerts', methods=['POST'])
+@admin_required
+def create_alerts():
+    """Creates several alerts in one request, over a single OpenVAS connection.
+
+    Expects a JSON payload with an "alerts" list, each entry having the fields accepted by /create_alert.
+
+    Returns:
+        JSON response: One result per alert, in order, with either its "id" or an "error" (200).
+    """
+    req = load_request(CreateAlertsRequest)  # Parse and validate every alert before creating any
+
+    try:
+        results = get_scanner().create_alerts([alert.model_dump() for alert in req.alerts])
+    except ValueError as e:
+        return ojson({"status": "error", "message": str(e)}, 400)  # Handle value errors with a 400 status
+    finally:
+        invalidate_lists('get_alerts')  # Some alerts may have been created even on failure
+
+    return ojson({"results": results})
+
+
+@scanner_bp.route('/delete_alerts', methods=['DELETE', 'POST'])
+@admin_required
+def delete_alerts():
+    """Deletes several alerts in one request, over a single OpenVAS connection.
+
+    Expects a JSON payload with an "alert_ids" list. POST is accepted as well as DELETE
+    for clients and proxies that drop DELETE bodies.
+
+    Returns:
+        JSON response: One result per alert ID, in order, with its status or an "error" (200).
+    """
+    req = load_request(DeleteAlertsRequest)  # Parse and validate the list of IDs
+
+    try:
+        results = get_scanner().delete_alerts(req.alert_ids)
+    except ValueError as e:
+        return ojson({"status": "error", "message": str(e)}, 400)  # Handle value errors with a 400 status
+    finally:
+        invalidate_lists('get_alerts')  # Some alerts may have been deleted even on failure
+
+    return ojson({"results": results})
+
+
+@scanner_bp.route('/delete_schedules', methods=['DELETE', 'POST'])
+@admin_required
+def delete_schedules():
+    """Deletes several schedules in one request, over a single OpenVAS connection.
+
+    Expects a JSON payload with a "schedule_ids" list. POST is accepted as well as DELETE
+    for clients and proxies that drop DELETE bodies.
+
+    Returns:
+        JSON response: One result per schedule ID, in order, with its status or an error (200).
+    """
+    req = load_request(DeleteSchedulesRequest)  # Parse and validate the list of IDs
+
+    try:
+        results = get_scanner().delete_schedules(req.schedule_ids)
+    except ValueError as e:
+        return ojson({"error": str(e)}, 400)
+    finally:
+        invalidate_lists('get_schedules')  # Some schedules may have been deleted even on failure
 
+    return ojson({"results": results})
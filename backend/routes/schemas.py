@@ -0,0 +1,142 @@
+from datetime import datetime
+from typing import Annotated, Dict, List, Optional, Union
+from flask import request
+from pydantic import BaseModel, Field
+
+# A string that must not be empty
+NonEmptyStr = Annotated[str, Field(min_length=1)]
+# An RFC 5545 recurrence frequency, in any case
+Frequency = Annotated[str, Field(pattern=r'(?i)^(secondly|minutely|hourly|daily|weekly|monthly|yearly)$')]
+# A comma-separated host string or a list of hosts
+Hosts = Union[NonEmptyStr, Annotated[List[str], Field(min_length=1)]]
+
+
+def load_request(model):
+    """
+    Parse and validate the JSON request body against a schema in a single pass.
+
+    Args:
+        model: The pydantic model describing the expected body.
+
+    Returns:
+        An instance of model.
+
+    Raises:
+        pydantic.ValidationError: If the body is not valid JSON or doesn't match the schema.
+    """
+    return model.model_validate_json(request.get_data())
+
+
+class HostEntry(BaseModel):
+    """A discovered host to turn into a target."""
+    ip: NonEmptyStr
+    hostname: Optional[str] = None
+
+
+class ConvertHostsRequest(BaseModel):
+    """Body of POST /scanner/convert_hosts_to_targets."""
+    hosts: List[HostEntry] = []
+    port_list_id: Optional[str] = None
+    port_range: Optional[str] = None
+
+
+class CreateTargetRequest(BaseModel):
+    """Body of POST /scanner/create_target."""
+    name: NonEmptyStr
+    hosts: Hosts
+    port_range: Optional[str] = None
+    port_list_id: Optional[str] = None
+    comment: Optional[str] = None
+
+
+class ModifyTargetRequest(BaseModel):
+    """Body of POST /scanner/modify_target/<target_id>."""
+    name: Optional[str] = None
+    hosts: Optional[Hosts] = None
+    exclude_hosts: Optional[str] = None
+    port_list_id: Optional[str] = None
+    comment: Optional[str] = None
+
+
+class CreateTaskRequest(BaseModel):
+    """Body of POST /scanner/create_task."""
+    name: NonEmptyStr
+    target_id: NonEmptyStr
+    config_id: NonEmptyStr
+    scanner_id: NonEmptyStr
+    schedule_id: Optional[str] = None
+    alert_ids: Optional[List[str]] = None
+
+
+class ModifyTaskRequest(BaseModel):
+    """Body of PUT /scanner/modify_task/<task_id>."""
+    name: Optional[str] = None
+    config_id: Optional[str] = None
+    scanner_id: Optional[str] = None
+    schedule_id: Optional[str] = None
+    alert_ids: Optional[List[str]] = None
+
+
+class CreateScheduleRequest(BaseModel):
+    """Body of POST /scanner/create_schedule."""
+    name: NonEmptyStr
+    dtstart: datetime
+    timezone: str = 'UTC'
+    comment: str = ''
+    frequency: Frequency = 'daily'
+    interval: Annotated[int, Field(gt=0)] = 1
+    count: Optional[Annotated[int, Field(gt=0)]] = None
+
+
+class ModifyScheduleRequest(BaseModel):
+    """Body of POST /scanner/modify_schedule."""
+    schedule_id: NonEmptyStr
+    name: NonEmptyStr
+    dtstart: datetime
+    timezone: Optional[str] = None
+    comment: Optional[str] = None
+    frequency: Frequency = 'daily'
+    interval: Annotated[int, Field(gt=0)] = 1
+    count: Optional[Annotated[int, Field(gt=0)]] = None
+
+
+class CreateAlertRequest(BaseModel):
+    """Body of POST /scanner/create_alert."""
+    name: NonEmptyStr
+    condition: NonEmptyStr
+    event: NonEmptyStr
+    method: NonEmptyStr
+    condition_data: Dict[str, str] = {}
+    event_data: Dict[str, str] = {}
+    method_data: Dict[str, str] = {}
+    filter_id: Optional[str] = None
+    comment: Optional[str] = None
+
+
+class ModifyAlertRequest(BaseModel):
+    """Body of POST /scanner/modify_alert."""
+    alert_id: NonEmptyStr
+    name: Optional[str] = None
+    condition: Optional[str] = None
+    event: Optional[str] = None
+    method: Optional[str] = None
+    condition_data: Optional[Dict[str, str]] = None
+    event_data: Optional[Dict[str, str]] = None
+    method_data: Optional[Dict[str, str]] = None
+    filter_id: Optional[str] = None
+    comment: Optional[str] = None
+
+
+class CreateAlertsRequest(BaseModel):
+    """Body of POST /scanner/create_alerts."""
+    alerts: Annotated[List[CreateAlertRequest], Field(min_length=1)]
+
+
+class DeleteAlertsRequest(BaseModel):
+    """Body of DELETE/POST /scanner/delete_alerts."""
+    alert_ids: Annotated[List[NonEmptyStr], Field(min_length=1)]
+
+
+class DeleteSchedulesRequest(BaseModel):
+    """Body of DELETE/POST /scanner/delete_schedules."""
+    schedule_ids: Annotated[List[NonEmptyStr], Field(min_length=1)]
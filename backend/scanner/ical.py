@@ -0,0 +1,74 @@
+"""
+Builds the iCalendar payloads OpenVAS schedules are created and modified with.
+
+Kept free of Flask and OpenVAS imports so it can be compiled ahead of time (e.g. with
+mypyc or Cython) without touching its callers.
+"""
+import time
+from datetime import timezone
+
+_UTC = timezone.utc  # Stdlib UTC for schedule timestamps
+
+# iCalendar payload for a schedule: a single recurring event. Property order matches what the
+# icalendar library used to emit.
+_ICS_TMPL = (
+    'BEGIN:VCALENDAR\r\n'
+    'VERSION:2.0\r\n'
+    'PRODID:-//VulunScan//\r\n'
+    'BEGIN:VEVENT\r\n'
+    'DTSTART:{dtstart}\r\n'
+    'DTSTAMP:{dtstamp}\r\n'
+    'RRULE:{rrule}\r\n'
+    'END:VEVENT\r\n'
+    'END:VCALENDAR\r\n'
+)
+_ICS_FREQUENCIES = frozenset(('SECONDLY', 'MINUTELY', 'HOURLY', 'DAILY', 'WEEKLY', 'MONTHLY', 'YEARLY'))
+
+# DTSTAMP only has one-second resolution, so the formatted stamp is reused for the rest of its second
+_dtstamp_cache = (0, '')
+
+def _dtstamp() -> str:
+    """
+    Return the current UTC time as an iCalendar DATE-TIME, formatting it at most once per second.
+    """
+    global _dtstamp_cache
+    now = int(time.time())
+    second, stamp = _dtstamp_cache  # Read both halves in one step so concurrent callers see a consistent pair
+    if second != now:
+        stamp = time.strftime('%Y%m%dT%H%M%SZ', time.gmtime(now))
+        _dtstamp_cache = (now, stamp)
+    return stamp
+
+def _ical_datetime(dt) -> str:
+    """
+    Format a datetime as an iCalendar DATE-TIME: floating if naive, UTC ('Z') if timezone-aware.
+    """
+    if dt.tzinfo is None:
+        return dt.strftime('%Y%m%dT%H%M%S')
+    return dt.astimezone(_UTC).strftime('%Y%m%dT%H%M%SZ')
+
+def make_icalendar(dtstart, frequency, interval, count) -> str:
+    """
+    Build the iCalendar data for a schedule: one event starting at dtstart that repeats
+    with the given frequency, interval and optional count, stamped with the current time.
+
+    Raises:
+        ValueError: If frequency is not an RFC 5545 frequency or interval/count aren't integers.
+    """
+    freq = str(frequency).upper()
+    if freq not in _ICS_FREQUENCIES:
+        raise ValueError(f"Invalid frequency: {frequency}")
+
+    # int() keeps request data from injecting iCalendar lines
+    rrule = 'FREQ=' + freq
+    if count:
+        rrule += f';COUNT={int(count)}'
+    interval = int(interval)
+    if interval != 1:
+        rrule += f';INTERVAL={interval}'  # INTERVAL defaults to 1 in RFC 5545, so it's only written when it differs
+
+    return _ICS_TMPL.format(
+        dtstart=_ical_datetime(dtstart),
+        dtstamp=_dtstamp(),
+        rrule=rrule,
+    )
@@ -1,19 +1,159 @@
+import io
+import logging
 import re
 from typing import Optional
 from gvm.connections import UnixSocketConnection
+from gvm.errors import InvalidArgument, InvalidArgumentType, RequiredArgument
 from gvm.protocols.gmp import Gmp
 from gvm.transforms import EtreeTransform
-from icalendar import Calendar
 from lxml import etree
 import csv
-import xlsxwriter
-from fpdf import FPDF
 from cachetools import cached, TTLCache
+from cachetools.keys import hashkey
+from config.config import CONFIG
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from operator import itemgetter
+import queue
+import threading
+import time
+
+# get_reports_with_tasks results keyed by filter string, kept for 1 minute so new reports from
+# finished scans show up soon
+cache = TTLCache(maxsize=32, ttl=60)
+cache_lock = threading.Lock()
+
+# The task_id -> task lookup used by get_reports_with_tasks, kept for 30 seconds
+tasks_cache = TTLCache(maxsize=1, ttl=30)
+tasks_cache_lock = threading.Lock()
+
+def invalidate_report_cache():
+    """
+    Drop the cached report listings after a report is deleted or a task changes.
+    """
+    with cache_lock:
+        cache.clear()
+
+def invalidate_task_cache():
+    """
+    Drop the cached task lookup after a task is created, modified or deleted. The report
+    listings carry task names, so they are dropped too.
+    """
+    with tasks_cache_lock:
+        tasks_cache.clear()
+    invalidate_report_cache()
+
+# Maximum number of idle authenticated GMP connections kept per scanner
+GMP_POOL_SIZE = 8
+# Seconds after which an idle pooled connection is closed instead of reused
+GMP_IDLE_TIMEOUT = 60
+
+# Errors a bulk operation records per item and moves past. They are raised before anything is
+# sent, so the connection is still usable; transport and GMP errors propagate so _connect drops it.
+_ITEM_ERRORS = (RequiredArgument, InvalidArgument, InvalidArgumentType, ValueError)
+
+# CVE identifiers mentioned in a result description
+_CVE_RE = re.compile(r'CVE-\d{4}-\d+')
+
+logger = logging.getLogger(__name__)
+
+# Compiled XPath evaluators for the queries that need the descendant axis, so the expressions
+# are compiled once instead of on every call. Entities that are direct children of a GMP
+# response root are iterated with iterfind() on the child axis instead.
+_ROLES_XP = etree.XPath('.//role')
+_ASSET_XP = etree.XPath('//asset')
+# The scalar fields of a target, fetched in one evaluation; results come back in document order
+_TARGET_FIELDS_XP = etree.XPath('name|comment|hosts|exclude_hosts|creation_time|modification_time')
+# The user ID is bound as an XPath variable, so it can't alter the query and the expression is compiled once
+_USER_BY_ID_XP = etree.XPath('.//user[@id=$uid]')
+_CONFIG_XP = etree.XPath('.//config')
+# Task, result, report, schedule and alert queries
+_TASK_XP = etree.XPath('.//task')
+_TASK_STATUS_XP = etree.XPath('.//status/text()')
+_RESULT_XP = etree.XPath('.//result')
+_REPORT_XP = etree.XPath('.//report')  # Also matches the <report> nested inside each listed report
+_REPORT_BY_ID_XP = etree.XPath('.//report[@id=$rid]')
+_REPORT_SEVERITIES_XP = etree.XPath('.//results/result/severity/text()', smart_strings=False)
+_SCHEDULE_XP = etree.XPath('//schedule')
+_ALERT_XP = etree.XPath('//alert')
+
+def _status_error(response):
+    """
+    Build the ValueError reported for a failed GMP response, from its status attributes.
+    """
+    attrib = response.attrib  # Bind the attribute view once
+    return ValueError(f"Error {attrib.get('status')}: {attrib.get('status_text')}")
 
-# Create a cache with a time-to-live (TTL) of 10 minutes
-# maxsize of 100 means the cache will store up to 100 entries
-# before evicting the least recently used ones.
-cache = TTLCache(maxsize=100, ttl=600)
+def _check_status(response, ok='200'):
+    """
+    Raise the response's ValueError unless its status is ok (201 for create commands).
+
+    Returns:
+        The (status, status_text) pair of the successful response.
+    """
+    attrib = response.attrib  # Bind the attribute view once
+    status = attrib.get('status')
+    if status != ok:
+        raise _status_error(response)
+    return status, attrib.get('status_text')
+
+def _debug_dump(label, response):
+    """
+    Log a GMP response as indented XML when OPENVAS_DEBUG is set and debug logging is on.
+    Both are off by default, since pretty-printing serializes the whole response.
+    """
+    if CONFIG.OPENVAS_DEBUG and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s:\n%s", label, etree.tostring(response, pretty_print=True).decode())
+
+def _role_to_dict(role_element):
+    """
+    Convert a GMP <role> element into the dictionary returned by get_roles.
+    """
+    findtext = role_element.findtext  # Bind the lookup once per role
+    return {
+        "id": role_element.get('id'),  # Extract the role ID attribute
+        "name": findtext('name', default=""),  # Get the role's name
+        "description": findtext('description', default=""),  # Get the description
+        # <permissions> holds one <permission> element per permission, not comma-separated text
+        "permissions": [permission.findtext('name', default="") for permission in role_element.iterfind('permissions/permission')],
+        "creation_time": findtext('creation_time', default=""),  # Role creation time
+        "modification_time": findtext('modification_time', default=""),  # Last modification time
+    }
+
+def _target_to_dict(target):
+    """
+    Convert a GMP <target> element into the dictionary returned by get_targets.
+    """
+    # Map each field to its text, keeping the first match and '' for an empty element like findtext does
+    texts = {}
+    for field in _TARGET_FIELDS_XP(target):
+        texts.setdefault(field.tag, field.text or '')
+    get = texts.get
+    return {
+        'id': target.get('id'),  # Get target ID
+        'name': get('name'),  # Get target name
+        'comment': get('comment'),  # Get target comment
+        'hosts': get('hosts'),  # Get target hosts
+        'exclude_hosts': get('exclude_hosts'),  # Get excluded hosts
+        'port_list': target.findtext('port_list/name'),  # Get port list name
+        'creation_time': get('creation_time'),  # Get target creation time
+        'modification_time': get('modification_time'),  # Get target modification time
+    }
+
+class _EtreeTransform(EtreeTransform):
+    """
+    EtreeTransform with a parser tuned for large GMP responses.
+
+    Keeps python-gvm's settings (huge_tree for big reports, no entity resolution) and adds
+    collect_ids=False, so libxml2 doesn't build an ID table for the many id attributes, and
+    remove_blank_text, so the indentation between elements isn't kept as text nodes.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._parser = etree.XMLParser(
+            encoding="utf-8", huge_tree=True, resolve_entities=False, collect_ids=False, remove_blank_text=True
+        )
 
 class OpenVASScanner:
     """
@@ -25,8 +165,6 @@ class OpenVASScanner:
         socket_path (str): The path to the Unix socket for OpenVAS.
         username (str): The username to authenticate with.
         password (str): The password to authenticate with.
-        connection (UnixSocketConnection): Connection object to communicate with OpenVAS.
-        transform (EtreeTransform): XML transformation object for converting responses.
     """
 
     def __init__(self, socket_path: str, username: str, password: str):
@@ -41,28 +179,95 @@ class OpenVASScanner:
         self.socket_path = socket_path
         self.username = username
         self.password = password
-        # Set up the Unix socket connection to OpenVAS
-        self.connection = UnixSocketConnection(path=self.socket_path)
-        # EtreeTransform is used to handle the XML responses from GMP
-        self.transform = EtreeTransform()
+        # Idle authenticated connections as (gmp, last used) pairs; LIFO keeps the warmest ones in use
+        self._pool = queue.LifoQueue(maxsize=GMP_POOL_SIZE)
 
-    def _connect(self) -> Gmp:
+    def _open(self):
         """
-        Establishes a connection to the OpenVAS GMP service.
-        
+        Opens and authenticates a new connection to the OpenVAS GMP service.
+
+        Each connection has its own Unix socket and EtreeTransform (whose lxml parser
+        isn't thread-safe), and is only ever used by one caller at a time.
+
         Returns:
-            Gmp: The GMP (Greenbone Management Protocol) connection object.
+            The connected and authenticated GMP protocol object.
+
+        Raises:
+            ValueError: If OpenVAS rejects the credentials.
         """
-        return Gmp(connection=self.connection, transform=self.transform)
+        gmp = Gmp(connection=UnixSocketConnection(path=self.socket_path), transform=_EtreeTransform()).__enter__()
+        try:
+            # authenticate() reports bad credentials through the response status instead of raising
+            _check_status(gmp.authenticate(self.username, self.password))
+        except BaseException:
+            gmp.disconnect()
+            raise
+        return gmp
+
+    @contextmanager
+    def _connect(self):
+        """
+        Checks out an authenticated GMP connection for the duration of a with block.
+
+        Connections are reused across calls so the socket handshake and authentication
+        only happen when the pool is empty. A connection is discarded instead of returned
+        if the block raises (it may have unread data) or it sat idle too long.
+
+        Yields:
+            The authenticated GMP protocol object.
+        """
+        gmp = None
+        while gmp is None:
+            try:
+                pooled, last_used = self._pool.get_nowait()
+            except queue.Empty:
+                gmp = self._open()
+                break
+            if time.monotonic() - last_used < GMP_IDLE_TIMEOUT:
+                gmp = pooled
+            else:
+                pooled.disconnect()  # gvmd may already have dropped it
+
+        try:
+            yield gmp
+        except BaseException:
+            gmp.disconnect()
+            raise
+
+        try:
+            self._pool.put_nowait((gmp, time.monotonic()))
+        except queue.Full:
+            gmp.disconnect()
+
+    def close(self):
+        """
+        Disconnects every idle pooled connection. Connections checked out at the time are
+        disconnected or pooled again when their callers are done with them.
+        """
+        while True:
+            try:
+                gmp, _ = self._pool.get_nowait()
+            except queue.Empty:
+                return
+            gmp.disconnect()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def authenticate(self):
         """
         Authenticates the user with OpenVAS using the provided credentials.
+
+        Always opens a fresh connection, so the credentials are actually checked.
+
+        Raises:
+            ValueError: If OpenVAS rejects the credentials.
         """
-        with self._connect() as gmp:
-            # Authenticate with the provided username and password
-            gmp.authenticate(self.username, self.password)
-            print("Authenticated successfully")
+        self._open().disconnect()
+        logger.debug("Authenticated successfully")
 
 
 
@@ -75,109 +280,71 @@ class OpenVASScanner:
                 - id (str): The unique identifier of the role.
                 - name (str): The name of the role.
                 - description (str): A brief description of the role.
-                - permissions (list): A list of permissions associated with the role.
+                - permissions (list): The names of the permissions listed for the role.
                 - creation_time (str): The time when the role was created.
                 - modification_time (str): The time when the role was last modified.
         :raises: ValueError if the request fails with an error.
         """
         with self._connect() as gmp:
-            # Authenticate the connection with the stored username and password
-            gmp.authenticate(self.username, self.password)
-            
             # Fetch the list of roles, using the filter "rows=-1" to get all roles
             response = gmp.get_roles(filter_string="rows=-1")
             
-            # Handle response based on the status code
-            if response.attrib.get('status') == '200':
-                # Parse the XML response into an ElementTree object
-                root = etree.fromstring(etree.tostring(response))
-                
-                # Initialize an empty list to store role data
-                roles = []
-                
-                # Iterate through all <role> elements in the response
-                for role_element in root.findall('.//role'):
-                    # Extract role information such as id, name, description, permissions, etc.
-                    role_data = {
-                        "id": role_element.get('id'),  # Extract the role ID attribute
-                        "name": role_element.findtext('name', default=""),  # Get the role's name
-                        "description": role_element.findtext('description', default=""),  # Get the description
-                        "permissions": role_element.findtext('permissions', default="").split(','),  # Permissions as a list
-                        "creation_time": role_element.findtext('creation_time', default=""),  # Role creation time
-                        "modification_time": role_element.findtext('modification_time', default=""),  # Last modification time
-                    }
-                    roles.append(role_data)  # Add the role data to the list
-                
-                return roles  # Return the list of roles
-            else:
-                # If the status is not '200', raise an error with the status and status_text
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                raise ValueError(f"Error {status}: {status_text}")
+            _check_status(response)  # Raise unless the request succeeded
 
+            # Convert each <role> child of the response
+            return [_role_to_dict(role_element) for role_element in response.iterfind('role')]
 
 
-    def get_users(self):
+
+    def iter_users(self):
         """
-        Retrieve a list of all users from OpenVAS, including their roles.
+        Yield every user in OpenVAS, including their roles, one dictionary at a time.
 
-        :return: A list of dictionaries, each representing a user and their associated roles.
+        The connection is returned to the pool as soon as the response has arrived. Each
+        <user> element is cleared once it has been converted, so the parsed response
+        shrinks as it is consumed instead of staying fully materialized next to the dicts.
+
+        :return: A generator of dictionaries, each representing a user and their associated roles.
+        :raises: ValueError if the request fails with an error.
         """
         with self._connect() as gmp:
-            # Authenticate with OpenVAS
-            gmp.authenticate(self.username, self.password)
-            
             # Fetch the list of users with no row limit
             response = gmp.get_users(filter_string="rows=-1")
 
-            # Uncomment the following lines to debug and inspect the raw XML response
-            # print("Full Users Response:")
-            # print(etree.tostring(response, pretty_print=True).decode())
+        _debug_dump("Full Users Response", response)  # Inspect the raw XML response when debugging
 
-            # Check if the response status is successful (status 200)
-            if response.attrib.get('status') == '200':
-                # Parse the XML response
-                root = etree.fromstring(etree.tostring(response))
+        # Raise an error if the response status is not successful
+        _check_status(response)
 
-                # List to hold user data
-                users = []
-                
-                # Iterate through all user elements in the XML
-                for user_element in root.findall('.//user'):
-                    user_id = user_element.get('id')  # Extract user ID
-                    user_name = user_element.findtext('name', default="")  # Extract username
-                    creation_time = user_element.findtext('creation_time', default="")  # Extract creation time
-                    modification_time = user_element.findtext('modification_time', default="")  # Extract modification time
-                    
-                    # Extract roles associated with the user
-                    roles = user_element.findall('.//role')
-                    user_roles = [
-                        {
-                            "id": role.get('id'),  # Extract role ID
-                            "name": role.findtext('name', default="")  # Extract role name
-                        }
-                        for role in roles
-                    ]
-
-                    # Structure the user data in a dictionary
-                    user_data = {
-                        "id": user_id,
-                        "name": user_name,
-                        "creation_time": creation_time,
-                        "modification_time": modification_time,
-                        "roles": user_roles  # Include the roles of the user
+        # Iterate through all user elements in the XML
+        for user_element in response.iterfind('user'):
+            findtext = user_element.findtext  # Bind the lookup once per user
+            # Structure the user data in a dictionary
+            user_data = {
+                "id": user_element.get('id'),  # Extract user ID
+                "name": findtext('name', default=""),  # Extract username
+                "creation_time": findtext('creation_time', default=""),  # Extract creation time
+                "modification_time": findtext('modification_time', default=""),  # Extract modification time
+                # Extract roles associated with the user
+                "roles": [
+                    {
+                        "id": role.get('id'),  # Extract role ID
+                        "name": role.findtext('name', default="")  # Extract role name
                     }
-                    
-                    # Append the user data to the list of users
-                    users.append(user_data)
+                    for role in _ROLES_XP(user_element)
+                ]
+            }
+            user_element.clear()  # Free the element's subtree; the iteration only needs the element itself
+            yield user_data
 
-                # Return the list of users and their roles
-                return users
-            else:
-                # Raise an error if the response status is not successful
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                raise ValueError(f"Error {status}: {status_text}")
+    def get_users(self):
+        """
+        Retrieve a list of all users from OpenVAS, including their roles.
+
+        :return: A list of dictionaries, each representing a user and their associated roles.
+        :raises: ValueError if the request fails with an error.
+        """
+        return list(self.iter_users())
 
 
     def get_user(self, user_id):
@@ -188,17 +355,15 @@ class OpenVASScanner:
         :return: A dictionary containing the user's details and associated roles.
         """
         with self._connect() as gmp:
-            # Authenticate with OpenVAS
-            gmp.authenticate(self.username, self.password)
-
             # Fetch the user data for the specified user ID
             response = gmp.get_user(user_id=user_id)
 
-            # Parse the XML response
-            root = etree.fromstring(etree.tostring(response))
+            # EtreeTransform already returns a parsed lxml element, so query it directly
+            root = response
 
             # Locate the user element with the matching user ID
-            user_element = root.find('.//user[@id="' + user_id + '"]')
+            matches = _USER_BY_ID_XP(root, uid=user_id)
+            user_element = matches[0] if matches else None
 
             # If the user is found, extract the relevant details
             if user_element is not None:
@@ -211,7 +376,7 @@ class OpenVASScanner:
                 }
 
                 # Extract roles associated with the user
-                roles_elements = user_element.findall('.//role')
+                roles_elements = _ROLES_XP(user_element)
                 for role in roles_elements:
                     role_data = {
                         "id": role.get('id'),  # Extract role ID
@@ -223,9 +388,7 @@ class OpenVASScanner:
                 return user_data
             else:
                 # Raise an error if the user element is not found
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                raise ValueError(f"Error {status}: {status_text}")
+                raise _status_error(response)
 
 
 
@@ -240,20 +403,11 @@ class OpenVASScanner:
         :return: A dictionary with the result of the creation.
         """
         with self._connect() as gmp:
-            # Authenticate with OpenVAS
-            gmp.authenticate(self.username, self.password)
-
             # Create the user with the provided name, password, and optional role IDs
             response = gmp.create_user(name=name, password=password, role_ids=role_ids or [])
 
-            # Check if the user creation was successful (status 201)
-            if response.attrib.get('status') == '201':
-                return {"status": "success", "message": "User created successfully"}  # Return success message
-            else:
-                # Handle failure cases by raising an error with the status and status text
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                raise ValueError(f"Error {status}: {status_text}")
+            _check_status(response, ok='201')  # Raise unless the user was created
+            return {"status": "success", "message": "User created successfully"}  # Return success message
 
 
     def modify_user(self, user_id, new_username=None, new_password=None, new_roles=None):
@@ -267,20 +421,11 @@ class OpenVASScanner:
         :return: A dictionary with the result of the modification.
         """
         with self._connect() as gmp:
-            # Authenticate with OpenVAS
-            gmp.authenticate(self.username, self.password)
-
             # Modify the user with the provided user ID, new username, new password, and optional new roles
             response = gmp.modify_user(user_id=user_id, name=new_username, password=new_password, role_ids=new_roles or [])
 
-            # Check if the user modification was successful (status 200)
-            if response.attrib.get('status') == '200':
-                return {"status": "success", "message": "User modified successfully"}  # Return success message
-            else:
-                # Handle failure cases by raising an error with the status and status text
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                raise ValueError(f"Error {status}: {status_text}")
+            _check_status(response)  # Raise unless the modification succeeded
+            return {"status": "success", "message": "User modified successfully"}  # Return success message
 
 
 
@@ -292,20 +437,11 @@ class OpenVASScanner:
         :return: A dictionary with the result of the deletion.
         """
         with self._connect() as gmp:
-            # Authenticate with OpenVAS
-            gmp.authenticate(self.username, self.password)
-
             # Attempt to delete the user with the specified user ID
             response = gmp.delete_user(user_id=user_id)
 
-            # Check if the deletion was successful (status 200)
-            if response.attrib.get('status') == '200':
-                return {"status": "success", "message": "User deleted successfully"}  # Return success message
-            else:
-                # Handle failure cases by raising an error with the status and status text
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                raise ValueError(f"Error {status}: {status_text}")
+            _check_status(response)  # Raise unless the deletion succeeded
+            return {"status": "success", "message": "User deleted successfully"}  # Return success message
 
 
 
@@ -320,9 +456,6 @@ class OpenVASScanner:
         :return: A dictionary indicating the success of the cloning operation, along with the name and comment of the cloned user.
         """
         with self._connect() as gmp:
-            # Authenticate with OpenVAS
-            gmp.authenticate(self.username, self.password)
-            
             # Fetch the original user by ID
             original_user_response = gmp.get_users(filter_string=f"id={user_id}")
             original_user = original_user_response.find('.//user')
@@ -350,59 +483,55 @@ class OpenVASScanner:
         :raises ValueError: If the scan configurations cannot be retrieved.
         """
         with self._connect() as gmp:
-            # Authenticate with OpenVAS
-            gmp.authenticate(self.username, self.password)
-
             # Fetch the scan configurations
             response = gmp.get_scan_configs()
-            configs = response.xpath('.//config')  # Extract all config elements
+            _check_status(response)  # Raise unless the request succeeded
+            configs = _CONFIG_XP(response)  # Extract all config elements
             
             # Check if configs were retrieved
             if not configs:
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                if status and status_text:
-                    raise ValueError(f"Error {status}: {status_text}")  # Raise error with status details
-                else:
-                    raise ValueError("Failed to retrieve scan configurations")  # Raise error if no status available
+                raise ValueError("Failed to retrieve scan configurations")
             
             return configs  # Return the list of configurations
 
 
-    def get_hosts(self):
+    def iter_hosts(self):
         """
-        Retrieve a list of all hosts from OpenVAS.
+        Yield every host in OpenVAS, one dictionary at a time.
 
-        :return: A list of dictionaries containing host details.
+        The connection is returned to the pool as soon as the response has arrived, and
+        each <asset> element is cleared once it has been converted.
+
+        :return: A generator of dictionaries containing host details.
         :raises ValueError: If the host retrieval fails.
         """
         with self._connect() as gmp:
-            # Authenticate with OpenVAS
-            gmp.authenticate(self.username, self.password)
-
             # Fetch the list of hosts
             response = gmp.get_hosts(filter_string="rows=-1")
-            
-            # Check for errors in the response
-            if response.attrib.get('status') == '400':
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                raise ValueError(f"Error {status}: {status_text}")  # Raise error with status details
-
-            # Extract host data
-            hosts = []
-            for asset in response.xpath('//asset'):
-                host_data = {
-                    'id': asset.attrib.get('id')  # Extract the host's ID
-                }
-                for identifier in asset.xpath('identifiers/identifier'):
-                    name = identifier.xpath('name/text()')[0] if identifier.xpath('name/text()') else None
-                    value = identifier.xpath('value/text()')[0] if identifier.xpath('value/text()') else None
-                    if name and value:
-                        host_data[name] = value  # Store host details
-                hosts.append(host_data)  # Add the host data to the list
-            
-            return hosts  # Return the list of hosts
+
+        _check_status(response)  # Raise unless the request succeeded
+
+        # Extract host data
+        for asset in _ASSET_XP(response):
+            host_data = {
+                'id': asset.attrib.get('id')  # Extract the host's ID
+            }
+            for identifier in asset.iterfind('identifiers/identifier'):
+                name = identifier.findtext('name')  # One descent per field instead of evaluating each XPath twice
+                value = identifier.findtext('value')
+                if name and value:
+                    host_data[name] = value  # Store host details
+            asset.clear()  # Free the asset's subtree now that it has been converted
+            yield host_data
+
+    def get_hosts(self):
+        """
+        Retrieve a list of all hosts from OpenVAS.
+
+        :return: A list of dictionaries containing host details.
+        :raises ValueError: If the host retrieval fails.
+        """
+        return list(self.iter_hosts())
 
 
     def delete_host(self, host_id):
@@ -414,26 +543,16 @@ class OpenVASScanner:
         :raises ValueError: If the host deletion fails or an unexpected error occurs.
         """
         with self._connect() as gmp:
-            # Authenticate with OpenVAS
-            gmp.authenticate(self.username, self.password)
-            
             try:
                 # Attempt to delete the host
                 response = gmp.delete_host(host_id=host_id)
+            except Exception as e:
+                # The request itself failed, so there is no response to take a status from
+                raise ValueError(f"Error unknown: {str(e)}")
 
-                # Check if the response contains the status
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                if status != '200':
-                    raise ValueError(f"Error {status}: {status_text}")  # Raise error for non-success status
+        _check_status(response)  # Raise unless the request succeeded
 
-                return {"message": "Host deleted successfully"}  # Return success message
-            
-            except Exception as e:
-                # Handle unexpected exceptions
-                status = response.attrib.get('status') if response.attrib else "unknown"
-                status_text = response.attrib.get('status_text') if response.attrib else str(e)
-                raise ValueError(f"Error {status}: {status_text}")  # Raise error with details
+        return {"message": "Host deleted successfully"}  # Return success message
 
 
     def get_scanners(self):
@@ -444,27 +563,13 @@ class OpenVASScanner:
         :raises ValueError: If the retrieval of scanners fails.
         """
         with self._connect() as gmp:
-            # Authenticate with OpenVAS
-            gmp.authenticate(self.username, self.password)
-
             # Fetch the list of scanners
             response = gmp.get_scanners()
             
-            # Check for errors in the response
-            if response.attrib.get('status') == '400':
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                raise ValueError(f"Error {status}: {status_text}")  # Raise error for non-success status
+            _check_status(response)  # Raise unless the request succeeded
             
-            # Extract scanner data
-            scanners = response.xpath('.//scanner')
-            available_scanners = []
-            for scanner in scanners:
-                scanner_id = scanner.xpath('@id')[0]  # Get the scanner ID
-                scanner_name = scanner.xpath('name/text()')[0]  # Get the scanner name
-                available_scanners.append((scanner_id, scanner_name))  # Store scanner details
-            
-            return available_scanners  # Return the list of available scanners
+            # Extract each scanner's ID and name
+            return [(scanner.get('id'), scanner.findtext('name')) for scanner in response.iterfind('scanner')]
 
         
     def get_portlists(self):
@@ -475,30 +580,20 @@ class OpenVASScanner:
         :raises ValueError: If the retrieval of port lists fails.
         """
         with self._connect() as gmp:
-            # Authenticate with OpenVAS
-            gmp.authenticate(self.username, self.password)
-
             # Fetch the list of port lists
             response = gmp.get_port_lists()
 
-            # Check for errors in the response
-            if response.attrib.get('status') == '400':
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                raise ValueError(f"Error {status}: {status_text}")  # Raise error for non-success status
+            _check_status(response)  # Raise unless the request succeeded
             
             # Extract port list data
-            portlists = response.xpath('.//port_list')
-            portlist_data = []
-            for portlist in portlists:
-                portlist_entry = {
-                    "id": portlist.xpath('@id')[0] if portlist.xpath('@id') else "N/A",  # Get port list ID
-                    "name": portlist.xpath('name/text()')[0] if portlist.xpath('name/text()') else "N/A",  # Get port list name
-                    "comment": portlist.xpath('comment/text()')[0] if portlist.xpath('comment/text()') else "No comment"  # Get port list comment
+            return [
+                {
+                    "id": portlist.get('id') or "N/A",  # Get port list ID
+                    "name": portlist.findtext('name') or "N/A",  # Get port list name
+                    "comment": portlist.findtext('comment') or "No comment"  # Get port list comment
                 }
-                portlist_data.append(portlist_entry)  # Add the entry to the list
-            
-            return portlist_data  # Return the list of port list details
+                for portlist in response.iterfind('port_list')
+            ]
 
 
     def get_targets(self, filter_string='rows=-1'):
@@ -510,29 +605,12 @@ class OpenVASScanner:
         :raises ValueError: If there's an error retrieving the targets.
         """
         with self._connect() as gmp:
-            # Authenticate with OpenVAS
-            gmp.authenticate(self.username, self.password)
-
             try:
                 # Retrieve targets with the specified filter
                 response = gmp.get_targets(filter_string=filter_string)
                 
                 # Parse the response and extract target details
-                targets = []
-                for target in response.xpath('//target'):
-                    target_data = {
-                        'id': target.get('id'),  # Get target ID
-                        'name': target.findtext('name'),  # Get target name
-                        'comment': target.findtext('comment'),  # Get target comment
-                        'hosts': target.findtext('hosts'),  # Get target hosts
-                        'exclude_hosts': target.findtext('exclude_hosts'),  # Get excluded hosts
-                        'port_list': target.findtext('port_list/name'),  # Get port list name
-                        'creation_time': target.findtext('creation_time'),  # Get target creation time
-                        'modification_time': target.findtext('modification_time'),  # Get target modification time
-                    }
-                    targets.append(target_data)  # Add target to the list
-                
-                return targets  # Return the list of targets
+                return [_target_to_dict(target) for target in response.iterfind('target')]
             
             except Exception as e:
                 # Raise an error if target retrieval fails
@@ -553,25 +631,11 @@ class OpenVASScanner:
         :raises ValueError: If the target creation fails or if the target ID cannot be retrieved.
         """
         with self._connect() as gmp:
-            # Authenticate with OpenVAS
-            gmp.authenticate(self.username, self.password)
-
             # Create the target using the provided details
             response = gmp.create_target(name=name, hosts=hosts, port_range=port_range, port_list_id=port_list_id, comment=comment)
 
-            # Extract the target ID from the response
-            target_id_elements = response.xpath('@id')
-            if not target_id_elements:
-                # Check for detailed error information
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                if status and status_text:
-                    raise ValueError(f"Error {status}: {status_text}")
-                else:
-                    raise ValueError("Failed to retrieve target ID and no detailed error information available.")
-
-            target_id = target_id_elements[0]  # Get the first target ID
-            return target_id  # Return the ID of the created target
+            _check_status(response, ok='201')  # Raise unless the target was created
+            return response.get('id')  # Return the ID of the created target
 
 
 
@@ -584,25 +648,16 @@ class OpenVASScanner:
         :raises ValueError: If the target deletion fails or if an unexpected error occurs.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
-
             try:
                 # Attempt to delete the target
                 response = gmp.delete_target(target_id=target_id)
+            except Exception as e:
+                # The request itself failed, so there is no response to take a status from
+                raise ValueError(f"Error unknown: {str(e)}")
 
-                # Check if the response contains the status
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                if status != '200':
-                    raise ValueError(f"Error {status}: {status_text}")
-
-                return {"message": "Target deleted successfully"}
+        _check_status(response)  # Raise unless the request succeeded
 
-            except Exception as e:
-                # Handle unexpected exceptions
-                status = response.attrib.get('status') if response.attrib else "unknown"
-                status_text = response.attrib.get('status_text') if response.attrib else str(e)
-                raise ValueError(f"Error {status}: {status_text}")
+        return {"message": "Target deleted successfully"}
 
 
     def modify_target(self, target_id, name=None, hosts=None, exclude_hosts=None, port_list_id=None, comment=None):
@@ -619,8 +674,6 @@ class OpenVASScanner:
         :raises ValueError: If the modification fails or if an unexpected error occurs.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
-
             try:
                 # Attempt to modify the target with provided parameters
                 response = gmp.modify_target(
@@ -632,11 +685,7 @@ class OpenVASScanner:
                     comment=comment
                 )
 
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-
-                if status != '200':
-                    raise ValueError(f"Error {status}: {status_text}")
+                status, status_text = _check_status(response)  # Raise unless the request succeeded
 
                 return {
                     "message": "Target modified successfully",
@@ -663,7 +712,6 @@ class OpenVASScanner:
         :raises ValueError: If task creation fails or if the task ID cannot be retrieved.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
             response = gmp.create_task(
                 name=name,
                 target_id=target_id,
@@ -672,17 +720,10 @@ class OpenVASScanner:
                 schedule_id=schedule_id,
                 alert_ids=alert_ids
             )
+            invalidate_task_cache()  # The task list changed
             
-            task_id = response.xpath('@id')
-            if not task_id:
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                if status and status_text:
-                    raise ValueError(f"Error {status}: {status_text}")
-                else:
-                    raise ValueError("Failed to create task or retrieve task ID")
-            
-            return task_id[0]
+            _check_status(response, ok='201')  # Raise unless the task was created
+            return response.get('id')  # Return the ID of the created task
 
 
 
@@ -694,7 +735,6 @@ class OpenVASScanner:
         :return: A dictionary containing the status and status text of the operation.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
             response = gmp.start_task(task_id=task_id)
             
             status = response.attrib.get('status', "unknown")
@@ -713,7 +753,6 @@ class OpenVASScanner:
         :return: A dictionary containing the status and status text of the operation.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
             response = gmp.stop_task(task_id=task_id)
             
             status = response.attrib.get('status', "unknown")
@@ -732,7 +771,6 @@ class OpenVASScanner:
         :return: A dictionary containing the status and status text of the operation.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
             response = gmp.resume_task(task_id=task_id)
             
             status = response.attrib.get('status', "unknown")
@@ -752,31 +790,21 @@ class OpenVASScanner:
         :return: A dictionary confirming the task deletion along with status details.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
-            
             try:
                 # Attempt to delete the task
                 response = gmp.delete_task(task_id=task_id)
-                
-                # Check the response status
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                
-                if status != '200':
-                    # If the status is not 200, raise a ValueError
-                    raise ValueError(f"Error {status}: {status_text}")
-                
-                return {
-                    "message": "Task deleted successfully",
-                    "status": status,
-                    "status_text": status_text
-                }
-            
             except Exception as e:
-                # Handle unexpected exceptions
-                status = response.attrib.get('status') if response.attrib else "unknown"
-                status_text = response.attrib.get('status_text') if response.attrib else str(e)
-                raise ValueError(f"Error {status}: {status_text}")
+                # The request itself failed, so there is no response to take a status from
+                raise ValueError(f"Error unknown: {str(e)}")
+        invalidate_task_cache()  # The task list changed
+
+        status, status_text = _check_status(response)  # Raise unless the request succeeded
+
+        return {
+            "message": "Task deleted successfully",
+            "status": status,
+            "status_text": status_text
+        }
 
 
 
@@ -793,8 +821,6 @@ class OpenVASScanner:
         :return: A dictionary confirming the task modification.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
-            
             try:
                 # Attempt to modify the task
                 response = gmp.modify_task(
@@ -805,20 +831,14 @@ class OpenVASScanner:
                     schedule_id=schedule_id,
                     alert_ids=alert_ids
                 )
-                
-                # Check if the response contains the updated task information
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                if status != '200':
-                    raise ValueError(f"Error {status}: {status_text}")
-
-                return {"message": "Task modified successfully"}
-            
             except Exception as e:
-                # Handle unexpected exceptions
-                status = response.attrib.get('status') if response.attrib else "unknown"
-                status_text = response.attrib.get('status_text') if response.attrib else str(e)
-                raise ValueError(f"Error {status}: {status_text}")
+                # The request itself failed, so there is no response to take a status from
+                raise ValueError(f"Error unknown: {str(e)}")
+        invalidate_task_cache()  # The task list changed
+
+        _check_status(response)  # Raise unless the request succeeded
+
+        return {"message": "Task modified successfully"}
 
 
 
@@ -829,29 +849,29 @@ class OpenVASScanner:
         :return: A list of tasks with their IDs, names, and statuses.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
-            response = gmp.get_tasks(filter_string="rows=-1")
+            # Only the id, name and status are read, so leave out the per-task details
+            response = gmp.get_tasks(filter_string="rows=-1", details=False)
             
-            # Check for errors in the response
-            if response.attrib.get('status') == '400':
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                raise ValueError(f"Error {status}: {status_text}")
+            _check_status(response)  # Raise unless the request succeeded
             
             # Extract task information from the response
-            tasks = response.xpath('.//task')
-            task_list = []
-            for task in tasks:
-                task_entry = {
-                    "id": task.xpath('@id')[0] if task.xpath('@id') else "N/A",
-                    "name": task.xpath('name/text()')[0] if task.xpath('name/text()') else "N/A",
-                    "status": task.xpath('status/text()')[0] if task.xpath('status/text()') else "N/A"
+            return [
+                {
+                    "id": task.get('id') or "N/A",
+                    "name": task.findtext('name') or "N/A",
+                    "status": task.findtext('status') or "N/A"
                 }
-                task_list.append(task_entry)
-            
-            return task_list
+                for task in _TASK_XP(response)
+            ]
 
 
+    @cached(tasks_cache, key=lambda self: hashkey('tasks_by_id'), lock=tasks_cache_lock)
+    def _tasks_by_id(self):
+        """
+        Return every task keyed by its ID, cached briefly so consecutive report listings share it.
+        """
+        return {task["id"]: task for task in self.get_tasks()}
+
     def get_task(self, task_id: str) -> dict:
         """
         Retrieve information about a specific task in OpenVAS using the GMP API.
@@ -863,7 +883,6 @@ class OpenVASScanner:
             A dictionary containing the task information from OpenVAS.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
             try:
                 # Request the specific task using its ID
                 response = gmp.get_task(task_id=task_id)
@@ -873,25 +892,32 @@ class OpenVASScanner:
                 if task is None:
                     raise ValueError("Failed to get task: Task element not found in response")
                 
+                # Look up the last report once; every last_report field is read from it
+                last_report = task.find('last_report/report')
+                if last_report is not None:
+                    last_report_info = {
+                        "id": last_report.get('id', 'Not available'),
+                        "timestamp": last_report.findtext('timestamp', default="Not available"),
+                        "scan_start": last_report.findtext('scan_start', default="Not available"),
+                        "scan_end": last_report.findtext('scan_end', default="Not available"),
+                    }
+                else:
+                    last_report_info = dict.fromkeys(("id", "timestamp", "scan_start", "scan_end"), "Not available")
+
                 # Extract task information from the response
+                owner = task.find('owner')
                 task_info = {
-                    "status": response.attrib.get('status', 'Unknown'),
                     "status_text": response.attrib.get('status_text', 'Unknown'),
                     "id": task.attrib.get('id', 'Unknown'),
                     "name": task.findtext('name', default="Not available"),
                     "comment": task.findtext('comment', default="Not available"),
                     "creation_time": task.findtext('creation_time', default="Not available"),
                     "modification_time": task.findtext('modification_time', default="Not available"),
-                    "owner": task.find('owner').findtext('name', default="Not available") if task.find('owner') is not None else "Not available",
+                    "owner": owner.findtext('name', default="Not available") if owner is not None else "Not available",
                     "status": task.findtext('status', default="Not available"),
                     "progress": task.findtext('progress', default="Not available"),
                     "report_count": task.findtext('report_count', default="Not available"),
-                    "last_report": {
-                        "id": task.find('last_report').find('report').attrib.get('id', 'Not available') if task.find('last_report') is not None and task.find('last_report').find('report') is not None else "Not available",
-                        "timestamp": task.find('last_report').find('report').findtext('timestamp', default="Not available") if task.find('last_report') is not None and task.find('last_report').find('report') is not None else "Not available",
-                        "scan_start": task.find('last_report').find('report').findtext('scan_start', default="Not available") if task.find('last_report') is not None and task.find('last_report').find('report') is not None else "Not available",
-                        "scan_end": task.find('last_report').find('report').findtext('scan_end', default="Not available") if task.find('last_report') is not None and task.find('last_report').find('report') is not None else "Not available",
-                    }
+                    "last_report": last_report_info
                 }
 
                 return task_info
@@ -912,16 +938,13 @@ class OpenVASScanner:
             A dictionary containing the task's status, message, and progress.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
             # Fetch the task details
             response = gmp.get_task(task_id=task_id)
             
-            # Extract status and status text from the response
-            status = response.attrib.get('status')
-            status_text = response.attrib.get('status_text')
+            status, status_text = _check_status(response)  # Raise unless the request succeeded
             
             # Retrieve the progress from the response
-            status_elements = response.xpath('.//status/text()')
+            status_elements = _TASK_STATUS_XP(response)
             progress = status_elements[0] if status_elements else "unknown"
             
             return {
@@ -942,30 +965,21 @@ class OpenVASScanner:
             A list of dictionaries containing the results of the task.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
             # Fetch the results for the task
             response = gmp.get_results(task_id=task_id, filter_string="rows=-1")
             
-            # Check for errors in the response
-            if response.attrib.get('status') == '400':
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                raise ValueError(f"Error {status}: {status_text}")
+            _check_status(response)  # Raise unless the request succeeded
             
-            # Extract results from the response
-            results = response.xpath('.//result')
-            result_list = []
-            for result in results:
-                # Create a dictionary for each result with relevant information
-                result_entry = {
-                    "id": result.xpath('@id')[0] if result.xpath('@id') else "N/A",
-                    "name": result.xpath('name/text()')[0] if result.xpath('name/text()') else "N/A",
-                    "description": result.xpath('description/text()')[0] if result.xpath('description/text()') else "N/A",
-                    "severity": result.xpath('severity/text()')[0] if result.xpath('severity/text()') else "N/A"
+            # Create a dictionary for each result with relevant information
+            return [
+                {
+                    "id": result.get('id') or "N/A",
+                    "name": result.findtext('name') or "N/A",
+                    "description": result.findtext('description') or "N/A",
+                    "severity": result.findtext('severity') or "N/A"
                 }
-                result_list.append(result_entry)
-            
-            return result_list
+                for result in _RESULT_XP(response)
+            ]
 
 
 
@@ -981,21 +995,17 @@ class OpenVASScanner:
             A list of reports, each represented as a dictionary.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
-            
             # Fetch the list of reports from OpenVAS
             response = gmp.get_reports(filter_string=filter_string)
             
-            # Optional: Print the full response to understand its structure (for debugging)
-            # print("Full Reports Response:")
-            # print(etree.tostring(response, pretty_print=True).decode())
+            _debug_dump("Full Reports Response", response)  # Inspect the raw XML response when debugging
             
-            # Parse the XML response
-            root = etree.fromstring(etree.tostring(response))
+            # EtreeTransform already returns a parsed lxml element, so query it directly
+            root = response
             
             # Extract report data
             reports = []
-            for report_element in root.findall('.//report'):
+            for report_element in _REPORT_XP(root):
                 report_id = report_element.get('id')
                 
                 # Extract task ID from the parent or related elements
@@ -1008,7 +1018,7 @@ class OpenVASScanner:
                     "creation_time": report_element.findtext('creation_time', default=""),
                     "modification_time": report_element.findtext('modification_time', default=""),
                     "scan_run_status": report_element.findtext('scan_run_status', default=""),
-                    "vulns_count": report_element.find('.//vulns/count').text if report_element.find('.//vulns/count') is not None else "0",
+                    "vulns_count": report_element.findtext('.//vulns/count') or "0",
                     "task_id": task_id
                 }
                 
@@ -1033,16 +1043,15 @@ class OpenVASScanner:
             ValueError: If the report cannot be found or if there's an error in the response.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
-            
             # Fetch the specific report
             response = gmp.get_report(report_id=report_id, filter_string="rows=-1")
             
-            # Parse the XML response
-            root = etree.fromstring(etree.tostring(response))
+            # EtreeTransform already returns a parsed lxml element, so query it directly
+            root = response
             
             # Extract the report element by ID
-            report_element = root.find('.//report[@id="' + report_id + '"]')
+            matches = _REPORT_BY_ID_XP(root, rid=report_id)
+            report_element = matches[0] if matches else None
             if report_element is not None:
                 # Extract task ID from related elements
                 task_id_element = root.find('.//task')
@@ -1054,35 +1063,37 @@ class OpenVASScanner:
                     "creation_time": report_element.findtext('creation_time', default=""),
                     "modification_time": report_element.findtext('modification_time', default=""),
                     "scan_run_status": report_element.findtext('scan_run_status', default=""),
-                    "vulns_count": report_element.find('.//vulns/count').text if report_element.find('.//vulns/count') is not None else "0",
+                    "vulns_count": report_element.findtext('.//vulns/count') or "0",
                     "task_id": task_id,
                     "results": []
                 }
                 
                 # Extract results from the report
-                results_elements = report_element.findall('.//results/result')
-                for result in results_elements:
-                    description = result.findtext('description', default="")
-                    cve_numbers = re.findall(r'CVE-\d{4}-\d+', description)
+                # Stream the results instead of collecting them into a list first
+                for result in report_element.iterfind('.//results/result'):
+                    # Collect the text of the result's children in one pass instead of searching
+                    # once per field, keeping the first of each tag like findtext does
+                    texts = {}
+                    for child in result:
+                        texts.setdefault(child.tag, child.text or "")
+                    description = texts.get('description', "")
+                    cve_numbers = _CVE_RE.findall(description)
                     
-                    # Extract port from <details> if available
+                    # Extract port from <details> if available, stopping at the first location
                     port = "N/A"
-                    details_elements = result.find('.//details')
-                    if details_elements is not None:
-                        for detail in details_elements.findall('.//detail'):
-                            name = detail.findtext('name', default="")
-                            if name == "location":
-                                port = detail.findtext('value', default="").split('/')[0]
-                                break
+                    for detail in result.iterfind('.//details/detail'):
+                        if detail.findtext('name', default="") == "location":
+                            port = detail.findtext('value', default="").split('/')[0]
+                            break
                     
                     result_data = {
                         "id": result.get('id'),
-                        "host": result.findtext('host', default=""),
+                        "host": texts.get('host', ""),
                         "port": port,
                         "description": description,
                         "cve_numbers": cve_numbers,
-                        "severity": result.findtext('severity', default=""),
-                        "threat": result.findtext('threat', default=""),
+                        "severity": texts.get('severity', ""),
+                        "threat": texts.get('threat', ""),
                     }
                     report_data["results"].append(result_data)
                 
@@ -1090,12 +1101,11 @@ class OpenVASScanner:
                 return report_data
             else:
                 # Handle case where the report is not found
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                raise ValueError(f"Error {status}: {status_text}")
+                raise _status_error(response)
 
 
-    @cached(cache)
+    # Keyed on the filter alone, so the entry doesn't hold on to (or depend on) the scanner instance
+    @cached(cache, key=lambda self, filter_string='rows=-1': hashkey(filter_string), lock=cache_lock)
     def get_reports_with_tasks(self, filter_string='rows=-1'):
         """
         Retrieve a list of reports along with associated task details and highest severity.
@@ -1107,20 +1117,25 @@ class OpenVASScanner:
         Returns:
             A list of reports, each represented as a dictionary with task details and highest severity.
         """
-        with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
+        # Fetch all tasks in a single call, on a second connection while the reports are fetched
+        executor = ThreadPoolExecutor(max_workers=1)
+        tasks_future = executor.submit(self._tasks_by_id)
+        executor.shutdown(wait=False)  # The submitted call still runs; nothing else is queued
 
-            # Fetch the list of reports
-            response = gmp.get_reports(filter_string=filter_string)
+        with self._connect() as gmp:
+            # Fetch the list of reports with every result embedded, so severities can be read from
+            # this one response instead of fetching each report separately
+            response = gmp.get_reports(filter_string=filter_string, details=True, ignore_pagination=True)
 
-            # Parse XML response
-            root = etree.fromstring(etree.tostring(response))
+            # EtreeTransform already returns a parsed lxml element, so query it directly
+            root = response
 
-            # Use a dictionary to store unique reports by report_id
+            # Use a dictionary to store unique reports by report_id, with the element each was read from
             unique_reports = {}
+            report_elements = {}
 
             # Extract report data
-            for report_element in root.findall('.//report'):
+            for report_element in _REPORT_XP(root):
                 report_id = report_element.get('id')
                 task_id_element = report_element.find('.//task')
                 task_id = task_id_element.get('id') if task_id_element is not None else "N/A"
@@ -1130,7 +1145,7 @@ class OpenVASScanner:
                     "name": report_element.findtext('name', default=""),
                     "creation_time": report_element.findtext('creation_time', default=""),
                     "modification_time": report_element.findtext('modification_time', default=""),
-                    "vulns_count": report_element.find('.//vulns/count').text or "0",
+                    "vulns_count": report_element.findtext('.//vulns/count') or "0",
                     "task_id": task_id,
                 }
 
@@ -1140,116 +1155,124 @@ class OpenVASScanner:
                     # Prefer report with non-empty 'name' and 'creation_time'
                     if not existing_report["name"] and report_data["name"]:
                         unique_reports[report_id] = report_data
+                        report_elements[report_id] = report_element
                 else:
                     unique_reports[report_id] = report_data
+                    report_elements[report_id] = report_element
 
-            # Fetch all tasks in a single call
-            tasks_info = {task["id"]: task for task in self.get_tasks()}
+        # Wait for the task list fetched alongside the reports
+        tasks_info = tasks_future.result()
 
-            # Final list of filtered and updated reports
-            filtered_reports = []
+        # Final list of filtered and updated reports
+        filtered_reports = []
 
-            # Calculate highest severity and update reports
-            for report in unique_reports.values():
-                report_id = report["id"]
-                task_id = report["task_id"]
-                report["task_name"] = tasks_info.get(task_id, {}).get("name", "Not available")
+        # Calculate highest severity and update reports
+        for report_id, report in unique_reports.items():
+            task_id = report["task_id"]
+            report["task_name"] = tasks_info.get(task_id, {}).get("name", "Not available")
 
-                # Fetch report details for severity calculation
-                report_details = self.get_report_by_id(report_id)
-                report_results = report_details.get("results", [])
+            # The outer and nested <report> elements share an ID, and either one contains the results.
+            # The XPath returns the severity strings directly, without a proxy per result element.
+            severities = _REPORT_SEVERITIES_XP(report_elements[report_id])
 
-                if report_results:  # Check if results are not empty
-                    highest_severity = max(float(result.get("severity", 0)) for result in report_results)
-                else:
-                    highest_severity = 0  # Set to 0 if there are no results
+            # Highest result severity, or 0 if there are no results
+            highest_severity = max(map(float, severities), default=0)
 
-                report["highest_severity"] = highest_severity
+            report["highest_severity"] = highest_severity
 
-                # Remove the 'scan_run_status' field if it exists
-                report.pop("scan_run_status", None)
+            # Remove the 'scan_run_status' field if it exists
+            report.pop("scan_run_status", None)
 
-                # Append the updated report to the final list
-                filtered_reports.append(report)
+            # Append the updated report to the final list
+            filtered_reports.append(report)
 
-            return filtered_reports
+        return filtered_reports
 
 
 
-    def export_report_to_csv(self, report_data, filename):
+    def export_report_to_csv(self, report_data, stream):
         """
-        Export the results of a report to a CSV file.
+        Export the results of a report as CSV.
 
         Args:
             report_data: A dictionary containing the report details, including results.
-            filename: The name of the file to which the report will be exported.
+            stream: A writable binary stream (e.g. io.BytesIO) the CSV is written to.
 
         Returns:
-            The filename of the exported CSV.
+            The stream the CSV was written to.
         """
-        with open(filename, 'w', newline='') as csvfile:
+        csvfile = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+        try:
             # Define the field names for the CSV
             fieldnames = ['id', 'host', 'port', 'description', 'cve_numbers', 'severity', 'threat']
             
-            # Create a DictWriter object with the specified fieldnames
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            # Create a writer for the CSV
+            writer = csv.writer(csvfile)
             
             # Write the header row to the CSV
-            writer.writeheader()
+            writer.writerow(fieldnames)
             
-            # Write each result to the CSV
-            for result in report_data['results']:
-                writer.writerow(result)
-        
-        return filename
+            # Write every result in one call, picking the fields in order with itemgetter
+            writer.writerows(map(itemgetter(*fieldnames), report_data['results']))
+        finally:
+            csvfile.flush()
+            csvfile.detach()  # Hand the binary stream back without closing it
 
+        return stream
 
-    def export_report_to_excel(self, report_data, filename):
+
+    def export_report_to_excel(self, report_data, stream):
         """
-        Export the results of a report to an Excel file.
+        Export the results of a report as an Excel workbook.
 
         Args:
             report_data: A dictionary containing the report details, including results.
-            filename: The name of the file to which the report will be exported.
+            stream: A writable binary stream (e.g. io.BytesIO) the workbook is written to.
 
         Returns:
-            The filename of the exported Excel file.
+            The stream the workbook was written to.
         """
-        # Create a new Excel workbook and add a worksheet
-        workbook = xlsxwriter.Workbook(filename)
+        import xlsxwriter  # Loaded on the first Excel export instead of by every worker at startup
+
+        # Create a new Excel workbook and add a worksheet. constant_memory flushes each row as it is
+        # written instead of holding the whole sheet in memory, and strings_to_urls=False skips the
+        # URL check on every string.
+        workbook = xlsxwriter.Workbook(stream, {'constant_memory': True, 'strings_to_urls': False})
         worksheet = workbook.add_worksheet()
 
         # Add headers to the first row of the worksheet
-        headers = ['ID', 'Host', 'Port', 'Description', 'CVE Numbers', 'Severity', 'Threat']
-        for col_num, header in enumerate(headers):
-            worksheet.write(0, col_num, header)
+        worksheet.write_row(0, 0, ('ID', 'Host', 'Port', 'Description', 'CVE Numbers', 'Severity', 'Threat'))
 
-        # Add data rows starting from the second row
+        # Add data rows starting from the second row, in order as constant_memory requires
         for row_num, result in enumerate(report_data['results'], 1):
-            worksheet.write(row_num, 0, result['id'])
-            worksheet.write(row_num, 1, result['host'])
-            worksheet.write(row_num, 2, result['port'])
-            worksheet.write(row_num, 3, result['description'])
-            worksheet.write(row_num, 4, ', '.join(result['cve_numbers']))  # Join CVE numbers as a string
-            worksheet.write(row_num, 5, result['severity'])
-            worksheet.write(row_num, 6, result['threat'])
-
-        # Close the workbook to save the file
+            worksheet.write_row(row_num, 0, (
+                result['id'],
+                result['host'],
+                result['port'],
+                result['description'],
+                ', '.join(result['cve_numbers']),  # Join CVE numbers as a string
+                result['severity'],
+                result['threat'],
+            ))
+
+        # Close the workbook to write it to the stream
         workbook.close()
-        return filename
+        return stream
 
 
-    def export_report_to_pdf(self, report_data, filename):
+    def export_report_to_pdf(self, report_data, stream):
         """
-        Export the results of a report to a PDF file.
+        Export the results of a report as a PDF document.
 
         Args:
             report_data: A dictionary containing the report details, including results.
-            filename: The name of the file to which the report will be exported.
+            stream: A writable binary stream (e.g. io.BytesIO) the PDF is written to.
 
         Returns:
-            The filename of the exported PDF file.
+            The stream the PDF was written to.
         """
+        from fpdf import FPDF  # Loaded on the first PDF export instead of by every worker at startup
+
         # Create a new PDF document
         pdf = FPDF()
         pdf.add_page()
@@ -1258,20 +1281,23 @@ class OpenVASScanner:
         # Add title to the PDF
         pdf.cell(200, 10, txt="Scan Report", ln=True, align='C')
 
-        # Add each result's details to the PDF
+        # Add each result's details to the PDF as one block; multi_cell breaks it into lines
+        # and wraps long descriptions instead of running them off the page
         for result in report_data['results']:
-            pdf.cell(200, 10, txt=f"ID: {result['id']}", ln=True)
-            pdf.cell(200, 10, txt=f"Host: {result['host']}", ln=True)
-            pdf.cell(200, 10, txt=f"Port: {result['port']}", ln=True)
-            pdf.cell(200, 10, txt=f"Description: {result['description']}", ln=True)
-            pdf.cell(200, 10, txt=f"CVE Numbers: {', '.join(result['cve_numbers'])}", ln=True)
-            pdf.cell(200, 10, txt=f"Severity: {result['severity']}", ln=True)
-            pdf.cell(200, 10, txt=f"Threat: {result['threat']}", ln=True)
-            pdf.cell(200, 10, txt=" ", ln=True)  # Add empty line between results
-
-        # Output the PDF to the specified filename
-        pdf.output(filename)
-        return filename
+            pdf.multi_cell(0, 10, txt=(
+                f"ID: {result['id']}\n"
+                f"Host: {result['host']}\n"
+                f"Port: {result['port']}\n"
+                f"Description: {result['description']}\n"
+                f"CVE Numbers: {', '.join(result['cve_numbers'])}\n"
+                f"Severity: {result['severity']}\n"
+                f"Threat: {result['threat']}\n"
+                " "  # Add empty line between results
+            ))
+
+        # Render the PDF to a string and write its bytes to the stream
+        stream.write(pdf.output(dest='S').encode('latin-1'))
+        return stream
 
     
 
@@ -1286,31 +1312,21 @@ class OpenVASScanner:
             A message indicating the result of the deletion operation.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
-            
             try:
                 # Attempt to delete the report
                 response = gmp.delete_report(report_id=report_id)
-                
-                # Check the response status
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-                
-                if status != '200':
-                    # If the status is not 200, raise a ValueError
-                    raise ValueError(f"Error {status}: {status_text}")
-                
-                return {
-                    "message": "Report deleted successfully",
-                    "status": status,
-                    "status_text": status_text
-                }
-            
             except Exception as e:
-                # Handle unexpected exceptions
-                status = response.attrib.get('status') if 'response' in locals() else "unknown"
-                status_text = response.attrib.get('status_text') if 'response' in locals() else str(e)
-                raise ValueError(f"Error {status}: {status_text}")
+                # The request itself failed, so there is no response to take a status from
+                raise ValueError(f"Error unknown: {str(e)}")
+        invalidate_report_cache()  # The report list changed
+
+        status, status_text = _check_status(response)  # Raise unless the request succeeded
+
+        return {
+            "message": "Report deleted successfully",
+            "status": status,
+            "status_text": status_text
+        }
 
 
 
@@ -1328,8 +1344,6 @@ class OpenVASScanner:
             str: The ID of the created schedule.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
-
             # Use GMP's create_schedule method to create the schedule
             response = gmp.create_schedule(
                 name=name,
@@ -1338,10 +1352,8 @@ class OpenVASScanner:
                 comment=comment
             )
             
-            # Extract the schedule ID from the response
-            schedule_id = response.xpath('//create_schedule_response/@id')[0]
-            
-            return schedule_id
+            _check_status(response, ok='201')  # Raise unless the schedule was created
+            return response.get('id')  # The ID is on the <create_schedule_response> root
 
 
 
@@ -1356,14 +1368,15 @@ class OpenVASScanner:
         Returns:
             list: A list of schedules, each represented as a dictionary.
         """
+        from icalendar import Calendar  # Only needed to read schedules back, so loaded on first use
+
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
             response = gmp.get_schedules(filter_string=filter_string)
 
             schedules = []  # Initialize an empty list to store schedules
 
             # Iterate through each schedule in the response
-            for schedule in response.xpath('//schedule'):
+            for schedule in _SCHEDULE_XP(response):
                 # Construct a dictionary to hold schedule data
                 schedule_data = {
                     'id': schedule.get('id'),
@@ -1431,8 +1444,6 @@ class OpenVASScanner:
             dict: A message indicating the result of the modification.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
-
             try:
                 # Use GMP's modify_schedule method to update the schedule
                 response = gmp.modify_schedule(
@@ -1443,16 +1454,9 @@ class OpenVASScanner:
                     comment=comment
                 )
 
-                # Extract status and status_text from the response
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
+                _check_status(response)  # Raise unless the modification succeeded
 
-                # Check if the modification was successful
-                if status == '200':
-                    return {"message": "Schedule modified successfully"}
-                else:
-                    # Raise an error if the status is not 200
-                    raise ValueError(f"Error {status}: {status_text}")
+                return {"message": "Schedule modified successfully"}
 
             except Exception as e:
                 # Handle unexpected exceptions gracefully
@@ -1467,19 +1471,11 @@ class OpenVASScanner:
         :return: A message indicating whether the deletion was successful.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
-            
             try:
                 # Attempt to delete the schedule
                 response = gmp.delete_schedule(schedule_id=schedule_id)
 
-                # Extract status and status_text
-                status = response.attrib.get('status')
-                status_text = response.attrib.get('status_text')
-
-                # Check if the operation was successful
-                if status != "200":
-                    raise ValueError(f"Error {status}: {status_text}")
+                _check_status(response)  # Raise unless the request succeeded
 
                 return {"message": "Schedule deleted successfully"}
 
@@ -1487,6 +1483,31 @@ class OpenVASScanner:
                 # Handle unexpected exceptions
                 raise ValueError(f"Unexpected error: {str(e)}")
 
+    def delete_schedules(self, schedule_ids: list[str]) -> list[dict]:
+        """
+        Delete several schedules in OpenVAS over one authenticated GMP connection.
+
+        Args:
+            schedule_ids: The UUIDs of the schedules to delete.
+
+        Returns:
+            A list with one entry per schedule ID, in order, holding its id and either the
+            response status or an error message.
+        """
+        results = []
+        with self._connect() as gmp:
+            for schedule_id in schedule_ids:
+                try:
+                    response = gmp.delete_schedule(schedule_id=schedule_id)
+                    results.append({
+                        "id": schedule_id,
+                        "status": response.attrib.get('status'),
+                        "status_text": response.attrib.get('status_text')
+                    })
+                except _ITEM_ERRORS as e:
+                    results.append({"id": schedule_id, "error": f"Failed to delete schedule: {str(e)}"})
+        return results
+
     def create_alert(
             self,
             name: str,
@@ -1518,7 +1539,6 @@ class OpenVASScanner:
             A dictionary containing the response from OpenVAS.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
             try:
                 # Use GMP's create_alert method to create a new alert
                 response = gmp.create_alert(
@@ -1532,15 +1552,39 @@ class OpenVASScanner:
                     filter_id=filter_id,
                     comment=comment
                 )
+                status, status_text = _check_status(response, ok='201')  # Raise unless the alert was created
                 return {
-                    "status": response.attrib.get('status'),
-                    "status_text": response.attrib.get('status_text'),
-                    "id": response.attrib.get('id')  # Extract and return the alert ID
+                    "status": status,
+                    "status_text": status_text,
+                    "id": response.get('id')  # Extract and return the alert ID
                 }
             except Exception as e:
                 raise ValueError(f"Failed to create alert: {str(e)}")
 
 
+    def create_alerts(self, alerts: list[dict]) -> list[dict]:
+        """
+        Create several alerts in OpenVAS over one authenticated GMP connection.
+
+        Args:
+            alerts: A list of dictionaries with the keyword arguments of create_alert for each alert.
+
+        Returns:
+            A list with one entry per alert, in order: {"id": ...} if it was created, {"error": ...} if not.
+        """
+        results = []
+        with self._connect() as gmp:
+            for alert in alerts:
+                try:
+                    # Use GMP's create_alert method to create each alert
+                    response = gmp.create_alert(**alert)
+                    _check_status(response, ok='201')  # A rejected alert is recorded like any other item error
+                    results.append({"id": response.get('id')})
+                except _ITEM_ERRORS as e:
+                    results.append({"error": f"Failed to create alert: {str(e)}"})
+        return results
+
+
     def get_alerts(self) -> dict:
         """
         Retrieve a list of alerts from OpenVAS using the GMP API.
@@ -1549,14 +1593,13 @@ class OpenVASScanner:
             A dictionary containing the list of alerts and their details.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
             try:
                 # Use GMP's get_alerts method to retrieve alerts
                 response = gmp.get_alerts() 
 
                 # Extract alert details from the response
                 alerts = []
-                for alert in response.xpath('//alert'):
+                for alert in _ALERT_XP(response):
                     alert_data = {
                         'id': alert.get('id'),  # Extract alert ID
                         'name': alert.findtext('name'),  # Extract alert name
@@ -1612,7 +1655,6 @@ class OpenVASScanner:
             A dictionary containing the response from OpenVAS.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
             try:
                 response = gmp.modify_alert(
                     alert_id=alert_id,
@@ -1644,7 +1686,6 @@ class OpenVASScanner:
             A dictionary containing the response from OpenVAS.
         """
         with self._connect() as gmp:
-            gmp.authenticate(self.username, self.password)
             try:
                 response = gmp.delete_alert(alert_id=alert_id)
                 return {
@@ -1654,3 +1695,28 @@ class OpenVASScanner:
             except Exception as e:
                 raise ValueError(f"Failed to delete alert: {str(e)}")
 
+    def delete_alerts(self, alert_ids: list[str]) -> list[dict]:
+        """
+        Delete several alerts in OpenVAS over one authenticated GMP connection.
+
+        Args:
+            alert_ids: The UUIDs of the alerts to delete.
+
+        Returns:
+            A list with one entry per alert ID, in order, holding its id and either the
+            response status or an error message.
+        """
+        results = []
+        with self._connect() as gmp:
+            for alert_id in alert_ids:
+                try:
+                    response = gmp.delete_alert(alert_id=alert_id)
+                    results.append({
+                        "id": alert_id,
+                        "status": response.attrib.get('status'),
+                        "status_text": response.attrib.get('status_text')
+                    })
+                except _ITEM_ERRORS as e:
+                    results.append({"id": alert_id, "error": f"Failed to delete alert: {str(e)}"})
+        return results
+
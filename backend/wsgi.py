@@ -0,0 +1,7 @@
+from gevent import monkey  # Import gevent's monkey patcher for cooperative I/O
+monkey.patch_all()  # Patch sockets, threading and queues before anything else imports them
+
+from app import create_app  # Import the application factory
+
+# Gunicorn's worker processes all write LOG_FILE, so leave its rotation to logrotate
+app = create_app(rotate_logs=False)  # Build the Flask application served by Gunicorn